@@ -1,52 +1,148 @@
-#include <cstring>
-#include <vector>
+#include <cstddef>
+#include <cstdint>
+#include <algorithm>
 #include <array>
-#include <string>
 
-extern "C" {
-    void compute_all_feedbacks(char** words, size_t word_count, int* feedback_matrix, size_t word_length) {
-        std::vector<std::string> wordList(word_count);
-        for (size_t i = 0; i < word_count; ++i) {
-            wordList[i] = std::string(words[i]);
+// Build with: g++ -O3 -shared -fPIC -o assets/feedbacks/feedbacks.so assets/feedbacks/feedbacks.cpp
+
+constexpr size_t kMaxWordLength = 32;
+
+// Bump this whenever a change here would change the feedback ids, along with kernel_version in feedbacks.py.
+// It is saved with the precomputed feedbacks so old files get recomputed.
+constexpr int kKernelVersion = 2;
+
+// Words are packed (word_count x word_length) arrays of letter codes (0 = 'a' ... 25 = 'z'),
+// the same arrays python uses everywhere so nothing has to be re-encoded on the way in.
+// Feedback ids go up to 3^word_length - 1 so the output type depends on the word length (uint8 up to 5, uint16 up to 10).
+
+// Feedback id for one guess and candidate
+inline int feedback_id(const uint8_t* guess, const uint8_t* candidate, size_t word_length) {
+    std::array<int, 26> letterCounts = {0};
+
+    for (size_t i = 0; i < word_length; ++i) {
+        ++letterCounts[candidate[i]];
+    }
+
+    std::array<int, kMaxWordLength> feedback = {0}; // 0: INVALID, 1: VALID, 2: CORRECT
+
+    // First pass: CORRECT
+    for (size_t i = 0; i < word_length; ++i) {
+        if (guess[i] == candidate[i]) {
+            feedback[i] = 2; // CORRECT
+            --letterCounts[guess[i]];
         }
+    }
 
-        for (size_t g = 0; g < word_count; ++g) {
-            const std::string& guess = wordList[g];
-            // printf("Calculating feedbacks for guess: %s.\n", guess.c_str());
-            for (size_t c = 0; c < word_count; ++c) {
-                const std::string& candidate = wordList[c];
-                std::array<int, 26> letterCounts = {0};
+    // Second pass: VALID
+    for (size_t i = 0; i < word_length; ++i) {
+        if (feedback[i] == 0 && letterCounts[guess[i]] > 0) {
+            feedback[i] = 1; // VALID
+            --letterCounts[guess[i]];
+        }
+    }
 
-                for (size_t i = 0; i < word_length; ++i) {
-                    ++letterCounts[candidate[i] - 'a'];
-                }
+    // Encode feedback as base-3 integer
+    int id = 0;
+    for (size_t i = 0; i < word_length; ++i) {
+        id = id * 3 + feedback[i];
+    }
+    return id;
+}
 
-                std::vector<int> feedback(word_length, 0); // 0: INVALID, 1: VALID, 2: CORRECT
+// Feedback ids for both directions of a pair of words (a guessed against b and b guessed against a).
+// Both directions have the same correct letters (green mask) so the first pass is shared, and the ids are built up
+// digit by digit during the second pass so there are no per pair feedback arrays to clear.
+inline void feedback_pair_ids(const uint8_t* a, const uint8_t* b, size_t word_length, int& a_against_b, int& b_against_a) {
+    std::array<uint8_t, 26> leftoverA = {0}; // Letters of a that aren't correct
+    std::array<uint8_t, 26> leftoverB = {0}; // Letters of b that aren't correct
+    uint32_t greenMask = 0; // Bit i is set if position i is CORRECT
 
-                // First pass: CORRECT
-                for (size_t i = 0; i < word_length; ++i) {
-                    if (guess[i] == candidate[i]) {
-                        feedback[i] = 2; // CORRECT
-                        --letterCounts[guess[i] - 'a'];
-                    }
-                }
+    // First pass: CORRECT (the same both ways)
+    for (size_t i = 0; i < word_length; ++i) {
+        if (a[i] == b[i]) {
+            greenMask |= 1u << i;
+        } else {
+            ++leftoverA[a[i]];
+            ++leftoverB[b[i]];
+        }
+    }
 
-                // Second pass: VALID
-                for (size_t i = 0; i < word_length; ++i) {
-                    if (feedback[i] == 0 && letterCounts[guess[i] - 'a'] > 0) {
-                        feedback[i] = 1; // VALID
-                        --letterCounts[guess[i] - 'a'];
-                    }
-                }
+    // Second pass: VALID, guessing a uses up the leftover letters of b and the other way around
+    a_against_b = 0;
+    b_against_a = 0;
+    for (size_t i = 0; i < word_length; ++i) {
+        int digitAB = 0; // 0: INVALID, 1: VALID, 2: CORRECT
+        int digitBA = 0;
+        if (greenMask & (1u << i)) {
+            digitAB = 2;
+            digitBA = 2;
+        } else {
+            if (leftoverB[a[i]] > 0) {
+                digitAB = 1;
+                --leftoverB[a[i]];
+            }
+            if (leftoverA[b[i]] > 0) {
+                digitBA = 1;
+                --leftoverA[b[i]];
+            }
+        }
+        // Encode as base-3 integers
+        a_against_b = a_against_b * 3 + digitAB;
+        b_against_a = b_against_a * 3 + digitBA;
+    }
+}
 
-                // Encode feedback as base-3 integer
-                int id = 0;
-                for (size_t i = 0; i < word_length; ++i) {
-                    id = id * 3 + feedback[i];
+// Fill the full (word_count x word_count) matrix working on each unordered pair once and writing both entries.
+// Pairs are done in square tiles so the rows written by (i, j) and the transposed rows written by (j, i) stay in cache.
+template <typename T>
+void compute_all_feedbacks_paired(const uint8_t* codes, size_t word_count, size_t word_length, T* feedback_matrix) {
+    constexpr size_t kTileSize = 64;
+    for (size_t tileI = 0; tileI < word_count; tileI += kTileSize) {
+        size_t endI = std::min(tileI + kTileSize, word_count);
+        for (size_t tileJ = tileI; tileJ < word_count; tileJ += kTileSize) {
+            size_t endJ = std::min(tileJ + kTileSize, word_count);
+            for (size_t i = tileI; i < endI; ++i) {
+                const uint8_t* a = codes + i * word_length;
+                for (size_t j = std::max(tileJ, i); j < endJ; ++j) {
+                    int aAgainstB, bAgainstA;
+                    feedback_pair_ids(a, codes + j * word_length, word_length, aAgainstB, bAgainstA);
+                    feedback_matrix[i * word_count + j] = static_cast<T>(aAgainstB);
+                    feedback_matrix[j * word_count + i] = static_cast<T>(bAgainstA);
                 }
-
-                feedback_matrix[g * word_count + c] = id;
             }
         }
     }
 }
+
+// Fill a (guess_count x candidate_count) block of feedbacks, used when only some rows or columns are needed.
+template <typename T>
+void compute_feedbacks_block(const uint8_t* guesses, size_t guess_count, const uint8_t* candidates, size_t candidate_count, size_t word_length, T* feedback_matrix) {
+    for (size_t g = 0; g < guess_count; ++g) {
+        const uint8_t* guess = guesses + g * word_length;
+        for (size_t c = 0; c < candidate_count; ++c) {
+            feedback_matrix[g * candidate_count + c] = static_cast<T>(feedback_id(guess, candidates + c * word_length, word_length));
+        }
+    }
+}
+
+extern "C" {
+    int feedbacks_kernel_version() {
+        return kKernelVersion;
+    }
+
+    void compute_all_feedbacks_paired_u8(const uint8_t* codes, size_t word_count, size_t word_length, uint8_t* feedback_matrix) {
+        compute_all_feedbacks_paired(codes, word_count, word_length, feedback_matrix);
+    }
+
+    void compute_all_feedbacks_paired_u16(const uint8_t* codes, size_t word_count, size_t word_length, uint16_t* feedback_matrix) {
+        compute_all_feedbacks_paired(codes, word_count, word_length, feedback_matrix);
+    }
+
+    void compute_feedbacks_block_u8(const uint8_t* guesses, size_t guess_count, const uint8_t* candidates, size_t candidate_count, size_t word_length, uint8_t* feedback_matrix) {
+        compute_feedbacks_block(guesses, guess_count, candidates, candidate_count, word_length, feedback_matrix);
+    }
+
+    void compute_feedbacks_block_u16(const uint8_t* guesses, size_t guess_count, const uint8_t* candidates, size_t candidate_count, size_t word_length, uint16_t* feedback_matrix) {
+        compute_feedbacks_block(guesses, guess_count, candidates, candidate_count, word_length, feedback_matrix);
+    }
+}
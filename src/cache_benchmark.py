@@ -0,0 +1,48 @@
+import argparse
+import os
+import tempfile
+import time
+import feedback_cache
+from words import get_all_words
+
+# Compares the feedback cache codecs by saving the real feedback matrix with each one and timing how long it takes to
+# load it back, so a deployment can pick between file size and load time.
+# Run from the repository root: python src/cache_benchmark.py
+
+def main():
+    parser = argparse.ArgumentParser(description="Report save time, file size and load time of each feedback cache codec")
+    parser.add_argument("--word-length", type=int, default=5)
+    parser.add_argument("--codecs", nargs="+", default=list(feedback_cache.codecs), help="Codecs to try")
+    parser.add_argument("--rows-per-chunk", type=int, nargs="+", default=[feedback_cache.default_rows_per_chunk], help="Chunk heights to try")
+    parser.add_argument("--repeats", type=int, default=3, help="Number of loads to take the best time of")
+    args = parser.parse_args()
+
+    words = get_all_words(args.word_length)
+    feedbacks = feedback_cache.get_feedbacks(words)
+
+    print(f"{'codec':<8}{'rows/chunk':>12}{'size MB':>10}{'save s':>10}{'load s':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        for codec in args.codecs:
+            # Chunk size doesn't mean anything for the npy codec so only do it once
+            for rows_per_chunk in (args.rows_per_chunk if codec != "npy" else [0]):
+                path = os.path.join(directory, f"{codec}-{rows_per_chunk}.h5")
+
+                start = time.perf_counter()
+                feedback_cache.save_feedbacks(feedbacks, words, path, codec, rows_per_chunk or 1)
+                save_time = time.perf_counter() - start
+
+                size = os.path.getsize(path)
+                if codec == "npy": size += os.path.getsize(feedback_cache.matrix_file_path(path))
+
+                # Take the best of a few loads so the numbers aren't thrown off by one slow read
+                load_time = float("inf")
+                for _ in range(args.repeats):
+                    start = time.perf_counter()
+                    loaded = feedback_cache.load_feedbacks(words, path)
+                    load_time = min(load_time, time.perf_counter() - start)
+                    assert loaded is not None and (loaded == feedbacks).all()
+
+                print(f"{codec:<8}{rows_per_chunk or '-':>12}{size / 1e6:>10.1f}{save_time:>10.2f}{load_time:>10.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+import numpy
+from letter_index import pack_bits, popcount, unpack_bits
+
+# Set of words from the full word list stored as a bitset (bit i is word i), so combining and comparing sets is just a
+# few vector operations over word_count / 64 blocks. Sets are never changed in place which lets them be used as dict keys.
+class CandidateSet:
+    __slots__ = ("bits", "word_count", "_count", "_hash")
+
+    def __init__(self, bits: numpy.ndarray, word_count: int):
+        self.bits: numpy.ndarray = bits
+        self.bits.flags.writeable = False
+        self.word_count: int = word_count
+        self._count: int | None = None # Worked out the first time len() is used
+        self._hash: int | None = None
+
+    @classmethod
+    def from_indices(cls, indices: numpy.ndarray, word_count: int) -> "CandidateSet":
+        mask = numpy.zeros(word_count, dtype=bool)
+        mask[indices] = True
+        return cls(pack_bits(mask), word_count)
+
+    @classmethod
+    def from_mask(cls, mask: numpy.ndarray) -> "CandidateSet":
+        return cls(pack_bits(mask), len(mask))
+
+    # Every word in the word list
+    @classmethod
+    def all(cls, word_count: int) -> "CandidateSet":
+        return cls.from_mask(numpy.ones(word_count, dtype=bool))
+
+    # Sorted indices of the words in the set
+    def to_indices(self) -> numpy.ndarray:
+        return numpy.flatnonzero(unpack_bits(self.bits, self.word_count))
+
+    def _check_compatible(self, other: "CandidateSet"):
+        if self.word_count != other.word_count:
+            raise ValueError(f"Can't combine sets over {self.word_count} and {other.word_count} words")
+
+    def __and__(self, other: "CandidateSet") -> "CandidateSet":
+        self._check_compatible(other)
+        return CandidateSet(self.bits & other.bits, self.word_count)
+
+    def __or__(self, other: "CandidateSet") -> "CandidateSet":
+        self._check_compatible(other)
+        return CandidateSet(self.bits | other.bits, self.word_count)
+
+    def __sub__(self, other: "CandidateSet") -> "CandidateSet":
+        self._check_compatible(other)
+        return CandidateSet(self.bits & ~other.bits, self.word_count)
+
+    def __len__(self) -> int:
+        if self._count is None:
+            self._count = popcount(self.bits)
+        return self._count
+
+    def __iter__(self):
+        return iter(self.to_indices().tolist())
+
+    def __contains__(self, index: int) -> bool:
+        if not 0 <= index < self.word_count: return False
+        return bool((int(self.bits[index // 64]) >> (index % 64)) & 1)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, CandidateSet) and self.word_count == other.word_count and numpy.array_equal(self.bits, other.bits)
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash((self.word_count, self.bits.tobytes()))
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"CandidateSet({len(self)} of {self.word_count} words)"
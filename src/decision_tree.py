@@ -0,0 +1,146 @@
+import argparse
+import os
+from collections import deque
+import numpy
+import feedback_cache
+from feedbacks import kernel_version
+from instrumentation import report_timings, timed
+from stuff import WordListProcessor, pattern_count, pattern_dtype
+from words import WordList, get_all_words
+
+# Decision tree of the solver's guesses worked out ahead of time: each node is the guess to make and its edges go to the
+# node for the next guess for each pattern that guess can give. With a tree loaded the next guess is a few lookups
+# instead of ranking the candidates. Build it from the repository root: python src/decision_tree.py
+#
+# Stored in compressed sparse row form so the file is just a handful of arrays:
+#   guesses        word index of the guess at each node (node 0 is the first guess)
+#   edge_offsets   edges of node i are edge_offsets[i]:edge_offsets[i + 1]
+#   edge_patterns  pattern id of each edge, sorted within each node
+#   edge_children  node reached by each edge
+# Getting every letter correct solves the game so there is no edge for that pattern.
+
+# Path of the decision tree file for a word length
+def tree_file_path(word_length: int) -> str:
+    return f"assets/feedbacks/decision-tree-{word_length}.npz"
+
+class DecisionTree:
+    def __init__(self, guesses: numpy.ndarray, edge_offsets: numpy.ndarray, edge_patterns: numpy.ndarray, edge_children: numpy.ndarray):
+        self.guesses: numpy.ndarray = guesses
+        self.edge_offsets: numpy.ndarray = edge_offsets
+        self.edge_patterns: numpy.ndarray = edge_patterns
+        self.edge_children: numpy.ndarray = edge_children
+
+    def __len__(self) -> int:
+        return len(self.guesses)
+
+    # Word index of the guess to make at a node
+    def guess(self, node: int) -> int:
+        return int(self.guesses[node])
+
+    # Node to go to after the guess at a node gave a pattern, or -1 if the tree doesn't go there
+    def child(self, node: int, pattern_id: int) -> int:
+        start, end = int(self.edge_offsets[node]), int(self.edge_offsets[node + 1])
+        position = start + int(numpy.searchsorted(self.edge_patterns[start:end], pattern_id))
+        if position < end and self.edge_patterns[position] == pattern_id:
+            return int(self.edge_children[position])
+        return -1
+
+    # Follow a game's patterns from the first guess down the tree, returns the node reached or -1 if it left the tree
+    def follow(self, pattern_ids: list[int]) -> int:
+        node = 0
+        for pattern_id in pattern_ids:
+            node = self.child(node, pattern_id)
+            if node == -1: break
+        return node
+
+    # Save to a compressed .npz along with what it was built for so out of date trees can be spotted
+    def save(self, words: WordList, path: str | None = None):
+        path = path or tree_file_path(words.word_length)
+        numpy.savez_compressed(
+            path,
+            guesses=self.guesses, edge_offsets=self.edge_offsets,
+            edge_patterns=self.edge_patterns, edge_children=self.edge_children,
+            word_length=words.word_length, kernel_version=kernel_version, words_hash=words.content_hash(), priors_hash=words.priors_hash()
+        )
+
+# Load the decision tree for a word list, returns None if there isn't one or it was built for something else
+def load_decision_tree(words: WordList, path: str | None = None) -> DecisionTree | None:
+    path = path or tree_file_path(words.word_length)
+    if not os.path.exists(path):
+        return None
+
+    with numpy.load(path) as f:
+        if (int(f["word_length"]) != words.word_length or int(f["kernel_version"]) != kernel_version or str(f["words_hash"]) != words.content_hash()
+                or "priors_hash" not in f or str(f["priors_hash"]) != words.priors_hash()):
+            print(f"Not using {path} because it was built for a different word list, priors or feedbacks kernel")
+            return None
+        return DecisionTree(f["guesses"], f["edge_offsets"], f["edge_patterns"], f["edge_children"])
+
+# Play the solver against every word at once: each node guesses the best ranked candidate and the candidates are split up
+# by the pattern that guess gives. Nodes are numbered in the order they are reached so each node's edges are contiguous.
+def build_decision_tree(processor: WordListProcessor) -> DecisionTree:
+    all_correct = pattern_count(processor.word_length) - 1 # Every letter correct
+    guesses: list[int] = []
+    edge_offsets: list[int] = [0]
+    edge_patterns: list[int] = []
+    edge_children: list[int] = []
+
+    queue = deque([processor.all_candidates]) # Candidates at each node that hasn't been expanded yet
+    while queue:
+        candidates = queue.popleft()
+        if len(candidates) == 1:
+            guess = int(candidates[0]) # Only one word left so guess it
+        elif candidates is processor.all_candidates:
+            guess = int(processor.sort_scores(processor.full_scores()[1], candidates)[0][0])
+        else:
+            guess = int(processor.rank(candidates)[0][0])
+        guesses.append(guess)
+
+        # Split the candidates up by the pattern they give for the guess (a stable sort keeps each group sorted)
+        feedback_row = processor.feedback_block(numpy.array([guess]), candidates)[0]
+        order = numpy.argsort(feedback_row, kind="stable")
+        patterns, starts = numpy.unique(feedback_row[order], return_index=True)
+        ends = numpy.append(starts[1:], len(order))
+        for pattern_id, start, end in zip(patterns.tolist(), starts, ends):
+            if pattern_id == all_correct: continue # Solved
+            edge_patterns.append(pattern_id)
+            edge_children.append(len(guesses) + len(queue))
+            queue.append(candidates[order[start:end]])
+        edge_offsets.append(len(edge_patterns))
+
+    return DecisionTree(
+        numpy.array(guesses, dtype=numpy.min_scalar_type(len(processor.all_words))),
+        numpy.array(edge_offsets, dtype=numpy.uint32),
+        numpy.array(edge_patterns, dtype=pattern_dtype(processor.word_length)),
+        numpy.array(edge_children, dtype=numpy.uint32)
+    )
+
+# Number of guesses needed for each node's guess to be the answer (the depth of the node plus one)
+def guess_counts(tree: DecisionTree) -> numpy.ndarray:
+    depths = numpy.zeros(len(tree), dtype=numpy.int64)
+    for node in range(len(tree)):
+        children = tree.edge_children[tree.edge_offsets[node]:tree.edge_offsets[node + 1]]
+        depths[children] = depths[node] + 1 # Children always come after their parent
+    return depths + 1
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the solver's decision tree")
+    parser.add_argument("--word-length", type=int, default=5, help="Number of letters in each word (4 to 8)")
+    parser.add_argument("--output", help="Where to save the tree (defaults to assets/feedbacks)")
+    args = parser.parse_args()
+
+    words = get_all_words(args.word_length)
+    processor = WordListProcessor(words, feedback_cache.get_feedbacks(words))
+
+    with timed("build decision tree"):
+        tree = build_decision_tree(processor)
+    with timed("save decision tree"):
+        tree.save(words, args.output)
+    report_timings()
+
+    counts = guess_counts(tree)
+    print(f"{len(tree)} nodes, {counts.mean():.3f} guesses on average, {counts.max()} at most, "
+          f"{(counts > 6).sum()} words take more than 6 guesses")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+import collections
+import os
+import threading
+import h5py
+import numpy
+from feedbacks import compute_feedback_block, compute_feedbacks, kernel_version
+from instrumentation import timed
+from stuff import pattern_dtype
+from words import WordList
+
+# The feedback matrix takes a while to compute so it is saved to disk the first time and loaded after that.
+# Each file has a "matrix" dataset, a "words" dataset with the word list it was made from and a header (attributes)
+# recording the word length, kernel version, codec and a hash of the word list. The header is checked before the matrix is
+# read so a file made from a different word list or an older kernel is never used.
+
+# The matrix can be stored in different ways depending on what matters more, file size or load time.
+# The "npy" codec stores it uncompressed in a separate .npy file next to the .h5 file so it can be read (or memory
+# mapped) straight into numpy. Every other codec is an HDF5 filter, stored in row aligned chunks so rows can be read
+# on their own. lz4 and zstd need the optional hdf5plugin package.
+codecs: dict[str, dict] = {
+    "none": {}, # Uncompressed
+    "gzip": {"compression": "gzip", "compression_opts": 4}, # Smallest file of the built in filters but slow
+    "lzf": {"compression": "lzf"}, # Fast, comes with h5py
+    "npy": {} # Raw numpy file, fastest to load
+}
+try:
+    import hdf5plugin
+    codecs["lz4"] = dict(hdf5plugin.LZ4())
+    codecs["zstd"] = dict(hdf5plugin.Zstd(clevel=3))
+except ImportError:
+    pass # Only the built in codecs are available
+
+# Codec used when saving, can be changed for a deployment with the FEEDBACKS_CACHE_CODEC environment variable
+default_codec = os.environ.get("FEEDBACKS_CACHE_CODEC", "zstd" if "zstd" in codecs else "lzf")
+default_rows_per_chunk = 64 # Number of matrix rows in each HDF5 chunk
+
+# Path of the precomputed feedbacks file for a word length
+def cache_file_path(word_length: int) -> str:
+    return f"assets/feedbacks/precomputed-feedbacks-{word_length}.h5"
+
+# Path of the separate matrix file used by the "npy" codec
+def matrix_file_path(path: str) -> str:
+    return os.path.splitext(path)[0] + ".npy"
+
+# Read the whole matrix from an open cache file
+def read_matrix(f: h5py.File) -> numpy.ndarray:
+    if f.attrs.get("codec") == "npy":
+        return numpy.load(matrix_file_path(f.filename))
+    return f["matrix"][:]
+
+# Check the header of an open cache file against a word list. Returns the reason it doesn't match or None if it does.
+def check_header(f: h5py.File, words: WordList) -> str | None:
+    if f.attrs.get("word_length") != words.word_length:
+        return "it was made for a different word length"
+    if f.attrs.get("kernel_version") != kernel_version:
+        return "it was made by a different version of the feedbacks kernel"
+    if f.attrs.get("words_hash") != words.content_hash():
+        return "the word list has changed"
+    if f.attrs.get("codec", "gzip") not in codecs:
+        return f"it uses the {f.attrs.get('codec')} codec which needs hdf5plugin"
+    return None
+
+# Load the precomputed feedbacks for a word list, returns None if there isn't a usable file
+def load_feedbacks(words: WordList, path: str | None = None) -> numpy.ndarray | None:
+    path = path or cache_file_path(words.word_length)
+    if not os.path.exists(path):
+        print(f"{path} not found")
+        return None
+
+    with h5py.File(path, "r") as f:
+        reason = check_header(f, words)
+        if reason is not None:
+            print(f"Not using {path} because {reason}")
+            return None
+        if f.attrs.get("codec") == "npy" and not os.path.exists(matrix_file_path(path)):
+            print(f"Not using {path} because {matrix_file_path(path)} is missing")
+            return None
+        return read_matrix(f)
+
+# Update out of date precomputed feedbacks to a new word list by only computing the rows and columns of words that
+# weren't in the old list, so adding k words costs O(n*k) instead of O(n^2). Words that were removed are just dropped.
+# Returns None if the file can't be reused (missing, different word length or kernel version, or no words in common).
+def update_feedbacks(words: WordList) -> numpy.ndarray | None:
+    path = cache_file_path(words.word_length)
+    if not os.path.exists(path):
+        return None
+
+    with h5py.File(path, "r") as f:
+        if f.attrs.get("word_length") != words.word_length or f.attrs.get("kernel_version") != kernel_version or "words" not in f or f.attrs.get("codec", "gzip") not in codecs:
+            return None
+        if f.attrs.get("codec") == "npy" and not os.path.exists(matrix_file_path(path)):
+            return None
+        old_words = WordList(f["words"][:])
+
+        # Find where each word was in the old list
+        old_indices = words.find_all(old_words.array) # Where each old word is in the new list
+        new_indices = old_words.find_all(words.array) # Where each new word was in the old list
+        kept = new_indices >= 0 # Which new words have already been computed
+        if not kept.any():
+            return None
+
+        print(f"Updating {path}: {int((~kept).sum())} words added, {int((old_indices < 0).sum())} words removed")
+        feedbacks = numpy.empty((len(words), len(words)), dtype=pattern_dtype(words.word_length))
+
+        # Copy over the feedbacks between words that were already there
+        kept_count = int(kept.sum())
+        if (new_indices[:kept_count] == numpy.arange(kept_count)).all() and kept_count == len(old_words):
+            # Words were only added to the end so the old matrix is just the top left corner
+            feedbacks[:kept_count, :kept_count] = read_matrix(f)
+        else:
+            old_matrix = read_matrix(f)
+            kept_positions = numpy.flatnonzero(kept)
+            feedbacks[numpy.ix_(kept_positions, kept_positions)] = old_matrix[numpy.ix_(new_indices[kept], new_indices[kept])]
+
+    # Compute the rows and columns of the new words
+    added_positions = numpy.flatnonzero(~kept)
+    if len(added_positions) > 0:
+        feedbacks[added_positions, :] = compute_feedback_block(words.codes[added_positions], words.codes)
+        feedbacks[:, added_positions] = compute_feedback_block(words.codes, words.codes[added_positions])
+    return feedbacks
+
+# Save the feedbacks for a word list using one of the codecs
+def save_feedbacks(feedbacks: numpy.ndarray, words: WordList, path: str | None = None, codec: str = default_codec, rows_per_chunk: int = default_rows_per_chunk):
+    if codec not in codecs:
+        raise ValueError(f"Unknown codec {codec!r}, available codecs are {', '.join(codecs)}")
+    path = path or cache_file_path(words.word_length)
+    feedbacks = feedbacks.astype(pattern_dtype(words.word_length), copy=False)
+
+    with h5py.File(path, "w") as f:
+        f.attrs["word_length"] = words.word_length
+        f.attrs["kernel_version"] = kernel_version
+        f.attrs["words_hash"] = words.content_hash()
+        f.attrs["codec"] = codec
+        f.create_dataset("words", data=words.array)
+        if codec == "npy":
+            numpy.save(matrix_file_path(path), feedbacks)
+        else:
+            # Chunks hold whole rows so reading some rows doesn't mean inflating the rest of the matrix
+            chunks = (max(1, min(rows_per_chunk, len(feedbacks))), max(1, feedbacks.shape[1]))
+            f.create_dataset("matrix", data=feedbacks, chunks=chunks, **codecs[codec])
+    if codec != "npy" and os.path.exists(matrix_file_path(path)):
+        os.remove(matrix_file_path(path)) # Left over from when the file was saved with the npy codec
+
+# Check if the precomputed feedbacks file for a word list is usable without reading the matrix
+def is_up_to_date(words: WordList, path: str | None = None) -> bool:
+    path = path or cache_file_path(words.word_length)
+    if not os.path.exists(path):
+        return False
+    with h5py.File(path, "r") as f:
+        if check_header(f, words) is not None:
+            return False
+        return f.attrs.get("codec") != "npy" or os.path.exists(matrix_file_path(path))
+
+# Read only view of the feedback matrix that stays on disk and reads rows when they are asked for, so the solver can run
+# on machines without enough memory for the whole matrix. Rows are read a chunk at a time (the chunks are whole rows)
+# and the most recently used chunks are kept in memory up to cache_megabytes.
+class DiskFeedbackMatrix:
+    def __init__(self, path: str, cache_megabytes: float = 64):
+        self.file = h5py.File(path, "r")
+        codec = self.file.attrs.get("codec", "gzip")
+        if codec not in codecs:
+            self.file.close()
+            raise ValueError(f"Can't read {path} because it uses the {codec} codec which needs hdf5plugin")
+        if codec == "npy":
+            # numpy can memory map the raw file so the operating system does the caching
+            self.dataset = numpy.load(matrix_file_path(path), mmap_mode="r")
+            self.rows_per_chunk = 1
+        else:
+            self.dataset = self.file["matrix"]
+            self.rows_per_chunk = self.dataset.chunks[0] if self.dataset.chunks else 64
+        self.shape: tuple[int, int] = self.dataset.shape
+        self.dtype: numpy.dtype = self.dataset.dtype
+
+        chunk_bytes = self.rows_per_chunk * self.shape[1] * self.dtype.itemsize
+        self.max_cached_chunks: int = max(1, int(cache_megabytes * 1e6 // chunk_bytes))
+        self.cached_chunks: collections.OrderedDict[int, numpy.ndarray] = collections.OrderedDict() # Chunk index -> rows
+        self.lock = threading.Lock() # The cache can be used from more than one thread
+
+    # Get the rows of a chunk, reading them from disk if they aren't cached
+    def chunk(self, chunk_index: int) -> numpy.ndarray:
+        with self.lock:
+            if chunk_index in self.cached_chunks:
+                self.cached_chunks.move_to_end(chunk_index) # Mark as most recently used
+                return self.cached_chunks[chunk_index]
+
+            start = chunk_index * self.rows_per_chunk
+            rows = numpy.asarray(self.dataset[start:start + self.rows_per_chunk])
+            self.cached_chunks[chunk_index] = rows
+            if len(self.cached_chunks) > self.max_cached_chunks:
+                self.cached_chunks.popitem(last=False) # Forget the least recently used chunk
+            return rows
+
+    # Get one row, or one row at some columns, the same as indexing a numpy array with [row] or [row, columns]
+    def __getitem__(self, key):
+        row, columns = key if isinstance(key, tuple) else (key, slice(None))
+        row = int(row)
+        return self.chunk(row // self.rows_per_chunk)[row % self.rows_per_chunk][columns]
+
+    # Get the (len(rows) x len(columns)) block of feedbacks for some rows and columns
+    def block(self, rows: numpy.ndarray, columns: numpy.ndarray) -> numpy.ndarray:
+        rows = numpy.asarray(rows)
+        result = numpy.empty((len(rows), len(columns)), dtype=self.dtype)
+        chunk_indices = rows // self.rows_per_chunk
+
+        # Read each chunk once and copy out all the rows that are in it
+        for chunk_index in numpy.unique(chunk_indices):
+            in_chunk = numpy.flatnonzero(chunk_indices == chunk_index)
+            chunk = self.chunk(int(chunk_index))
+            result[in_chunk] = chunk[rows[in_chunk] % self.rows_per_chunk][:, columns]
+        return result
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def close(self):
+        self.file.close()
+
+# Open the feedbacks for a word list as a disk backed matrix, computing and saving them first if needed
+def open_feedbacks(words: WordList, cache_megabytes: float = 64) -> DiskFeedbackMatrix:
+    if not is_up_to_date(words):
+        get_feedbacks(words) # Brings the file up to date
+    return DiskFeedbackMatrix(cache_file_path(words.word_length), cache_megabytes)
+
+# Load the feedbacks for a word list, computing and saving them first if the saved ones are missing or out of date
+def get_feedbacks(words: WordList) -> numpy.ndarray:
+    print("Loading precomputed feedbacks")
+    with timed("load precomputed feedbacks"):
+        feedbacks = load_feedbacks(words)
+
+    if feedbacks is None:
+        # Try to reuse the out of date file by only computing what changed
+        with timed("update feedbacks"):
+            feedbacks = update_feedbacks(words)
+        if feedbacks is not None:
+            print("Saving feedbacks")
+            with timed("save feedbacks"):
+                save_feedbacks(feedbacks, words)
+            return feedbacks
+
+        # Invoke shared library to compute it then save to database file
+        print("Computing feedbacks")
+        with timed("compute feedbacks"):
+            feedbacks = compute_feedbacks(words)
+        print("Saving feedbacks")
+        with timed("save feedbacks"):
+            save_feedbacks(feedbacks, words)
+    return feedbacks
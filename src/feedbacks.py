@@ -1,35 +1,137 @@
 import ctypes
 import platform
+import numpy
+from instrumentation import timed
+from words import WordList
+from stuff import pattern_dtype
 
 # Invokes a C++ function from a shared library to compute the feedbacks because python is too slow to do this.
 library_path = ""
 # Different library depending on platform
 if platform.system() == "Linux": library_path = "assets/feedbacks/feedbacks.so"
 elif platform.system() == "Windows": library_path = "assets/feedbacks/feedbacks.dll"
-feedback_library = ctypes.CDLL(library_path) # Load library
-feedback_library.compute_all_feedbacks.argtypes = [
-    ctypes.POINTER(ctypes.c_char_p), ctypes.c_size_t,
-    ctypes.POINTER(ctypes.c_int), ctypes.c_size_t
-] # Set the argument types for the function
-feedback_library.compute_all_feedbacks.restype = None # Doesnt return anything
-def compute_feedbacks(words: list[str], word_length: int) -> list[list[int]]:
-    print("Packing inputs to compute feedbacks.")
-    word_count = len(words)
-
-    c_words = (ctypes.c_char_p * word_count)(*[
-        ctypes.create_string_buffer(w.encode("utf-8")).value for w in words
-    ]) # Convert python strings to C strings
-
-    # Squish 2D matrix into 1D matrix
-    feedback_matrix = (ctypes.c_int * (word_count * word_count))()
+_feedback_library: ctypes.CDLL | None = None
+_feedback_library_loaded: bool = False
+
+# Version of the feedback algorithm, saved with the precomputed feedbacks so they get recomputed when it changes.
+# Has to match kKernelVersion in feedbacks.cpp.
+kernel_version = 2
+
+# Names of the functions in the library and the C type of the matrix they fill (one for each output type)
+_block_functions = (("compute_feedbacks_block_u8", ctypes.c_uint8), ("compute_feedbacks_block_u16", ctypes.c_uint16))
+_paired_functions = (("compute_all_feedbacks_paired_u8", ctypes.c_uint8), ("compute_all_feedbacks_paired_u16", ctypes.c_uint16))
+
+# Load the shared library the first time it is needed instead of when this module is imported.
+# Returns None if the library is out of date.
+def get_feedback_library() -> ctypes.CDLL | None:
+    global _feedback_library, _feedback_library_loaded
+    if not _feedback_library_loaded:
+        with timed("load feedbacks library"):
+            try:
+                library = ctypes.CDLL(library_path) # Load library
+            except OSError as error:
+                # Not built for this platform yet, so the numpy version is used instead
+                print(f"Couldn't load the feedbacks library ({error}), build it from feedbacks.cpp to compute feedbacks faster.")
+                library = None
+
+            # A library built from a different version of feedbacks.cpp might give different answers or be missing functions
+            library_version = library.feedbacks_kernel_version() if hasattr(library, "feedbacks_kernel_version") else 0
+            if library is not None and (library_version != kernel_version or not all(hasattr(library, name) for name, _ in _block_functions + _paired_functions)):
+                print(f"Feedbacks library is version {library_version} but version {kernel_version} is needed, rebuild it from feedbacks.cpp.")
+                library = None
+            if library is not None:
+                # One version of the function for each output type
+                for function_name, c_type in _block_functions:
+                    function = getattr(library, function_name)
+                    function.argtypes = [
+                        ctypes.POINTER(ctypes.c_uint8), ctypes.c_size_t,
+                        ctypes.POINTER(ctypes.c_uint8), ctypes.c_size_t,
+                        ctypes.c_size_t, ctypes.POINTER(c_type)
+                    ] # Set the argument types for the function
+                    function.restype = None # Doesnt return anything
+                for function_name, c_type in _paired_functions:
+                    function = getattr(library, function_name)
+                    function.argtypes = [
+                        ctypes.POINTER(ctypes.c_uint8), ctypes.c_size_t, ctypes.c_size_t,
+                        ctypes.POINTER(c_type)
+                    ] # Set the argument types for the function
+                    function.restype = None # Doesnt return anything
+        _feedback_library = library
+        _feedback_library_loaded = True
+    return _feedback_library
+
+# Compute the feedback id for every (guess, candidate) pair. Row is the guess and column is the candidate.
+# The matrix uses the smallest type that fits every pattern id for the word length.
+def compute_feedbacks(words: WordList) -> numpy.ndarray:
+    feedback_library = get_feedback_library()
+    if feedback_library is None:
+        return compute_feedback_block(words.codes, words.codes) # Falls back to numpy
 
     print("Computing feedbacks.")
-    feedback_library.compute_all_feedbacks(c_words, word_count, feedback_matrix, word_length) # Run function
+    codes = words.codes # Already packed as one contiguous block of letter codes so it can be passed straight in
+    dtype = pattern_dtype(words.word_length)
+    feedback_matrix = numpy.empty((len(codes), len(codes)), dtype=dtype) # The kernel writes straight into this
+
+    # The paired kernel works out each pair of words once and fills in both (guess, candidate) entries
+    function_name, c_type = _paired_functions[0] if dtype == numpy.uint8 else _paired_functions[1]
+    getattr(feedback_library, function_name)(
+        codes.ctypes.data_as(ctypes.POINTER(ctypes.c_uint8)), len(codes), words.word_length,
+        feedback_matrix.ctypes.data_as(ctypes.POINTER(c_type))
+    ) # Run function
+
+    return feedback_matrix
+
+# Compute the feedbacks for some guesses against some candidates, both given as packed arrays of letter codes.
+# Used to fill in just the new rows and columns when words are added to the word list.
+def compute_feedback_block(guess_codes: numpy.ndarray, candidate_codes: numpy.ndarray) -> numpy.ndarray:
+    feedback_library = get_feedback_library()
+
+    # The kernel needs one contiguous block of letter codes for each side
+    guess_codes = numpy.ascontiguousarray(guess_codes, dtype=numpy.uint8)
+    candidate_codes = numpy.ascontiguousarray(candidate_codes, dtype=numpy.uint8)
+    word_length = guess_codes.shape[1]
+    dtype = pattern_dtype(word_length)
+    feedback_matrix = numpy.empty((len(guess_codes), len(candidate_codes)), dtype=dtype) # The kernel writes straight into this
+
+    if feedback_library is None:
+        # Library was built from an old version of feedbacks.cpp so do it (slowly) with numpy instead
+        print("Falling back to numpy to compute feedbacks.")
+        _compute_feedbacks_numpy(guess_codes, candidate_codes, feedback_matrix)
+        return feedback_matrix
+
+    function_name, c_type = _block_functions[0] if dtype == numpy.uint8 else _block_functions[1]
+    getattr(feedback_library, function_name)(
+        guess_codes.ctypes.data_as(ctypes.POINTER(ctypes.c_uint8)), len(guess_codes),
+        candidate_codes.ctypes.data_as(ctypes.POINTER(ctypes.c_uint8)), len(candidate_codes),
+        word_length, feedback_matrix.ctypes.data_as(ctypes.POINTER(c_type))
+    ) # Run function
+
+    return feedback_matrix
+
+# Same as the C++ kernel but done one guess (row) at a time with numpy
+def _compute_feedbacks_numpy(guess_codes: numpy.ndarray, candidate_codes: numpy.ndarray, feedback_matrix: numpy.ndarray):
+    word_length = guess_codes.shape[1]
+    candidate_indices = numpy.arange(len(candidate_codes))
+    powers = 3 ** numpy.arange(word_length - 1, -1, -1) # Base-3 place values, first letter is the most significant
+
+    # Number of times each letter occurs in each candidate
+    candidate_counts = numpy.zeros((len(candidate_codes), 26), dtype=numpy.int16)
+    for i in range(word_length):
+        candidate_counts[candidate_indices, candidate_codes[:, i]] += 1
+
+    for g, guess in enumerate(guess_codes):
+        correct = candidate_codes == guess # Which letters of each candidate are in the right place
+        feedback = numpy.where(correct, 2, 0)
+
+        # Count the letters in each candidate that weren't matched by a correct letter
+        letter_counts = candidate_counts.copy()
+        for i in range(word_length):
+            letter_counts[:, guess[i]] -= correct[:, i]
 
-    print("Unpacking results from feedbacks compute.")
-    result = [
-        [feedback_matrix[i * word_count + j] for j in range(word_count)]
-        for i in range(word_count)
-    ] # Unpack squished 2D matrix into 2D matrix
+        # Second pass: VALID
+        for i in range(word_length):
+            valid = ~correct[:, i] & (letter_counts[:, guess[i]] > 0)
+            feedback[valid, i] = 1
+            letter_counts[candidate_indices[valid], guess[i]] -= 1
 
-    return result
\ No newline at end of file
+        feedback_matrix[g] = feedback @ powers
@@ -0,0 +1,32 @@
+import importlib
+import time
+
+# Simple timing helpers so we can see where startup time goes.
+timings: dict[str, float] = {} # Label -> seconds taken
+
+# Time a block of code and record it under a label. Use with a "with" statement.
+class timed:
+    def __init__(self, label: str):
+        self.label: str = label
+        self.start: float = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.start
+        timings[self.label] = timings.get(self.label, 0) + elapsed
+        print(f"{self.label} took {elapsed * 1000:.1f} ms")
+
+# Import a module by name and record how long it took.
+# Modules that are already imported come straight from sys.modules so they are basically free.
+def timed_import(module_name: str):
+    with timed(f"import {module_name}"):
+        return importlib.import_module(module_name)
+
+# Print every recorded timing, slowest first
+def report_timings():
+    print("Timings:")
+    for label, seconds in sorted(timings.items(), key=lambda item: item[1], reverse=True):
+        print(f"  {label:<40} {seconds * 1000:8.1f} ms")
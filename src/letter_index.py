@@ -0,0 +1,79 @@
+import numpy
+from words import WordList
+
+# Bitsets are numpy arrays of uint64 blocks with one bit per word in the full word list (bit i of the set is word i).
+
+# Pack a boolean array (one entry per word) into a bitset
+def pack_bits(mask: numpy.ndarray) -> numpy.ndarray:
+    block_count = (len(mask) + 63) // 64
+    packed = numpy.zeros(block_count * 8, dtype=numpy.uint8)
+    packed[:(len(mask) + 7) // 8] = numpy.packbits(mask, bitorder="little")
+    return packed.view(numpy.uint64)
+
+# Unpack a bitset back into a boolean array with one entry per word
+def unpack_bits(bits: numpy.ndarray, word_count: int) -> numpy.ndarray:
+    return numpy.unpackbits(bits.view(numpy.uint8), count=word_count, bitorder="little").view(bool)
+
+# Number of bits that are set
+def popcount(bits: numpy.ndarray) -> int:
+    if hasattr(numpy, "bitwise_count"): # numpy 2.0+
+        return int(numpy.bitwise_count(bits).sum())
+    return int(numpy.unpackbits(bits.view(numpy.uint8)).sum())
+
+# Precomputed bitsets over the word list so letter constraints are just a few bitwise ANDs
+class LetterIndex:
+    def __init__(self, words: WordList):
+        self.word_count: int = len(words)
+        self.word_length: int = words.word_length
+        codes = words.codes
+        letter_counts = words.letter_counts
+
+        # position_bits[i, letter] is the set of words that have letter at position i
+        self.position_bits: numpy.ndarray = numpy.stack([
+            numpy.stack([pack_bits(codes[:, i] == letter) for letter in range(26)])
+            for i in range(self.word_length)
+        ])
+
+        # count_bits[letter, k] is the set of words that have letter at least k times (k = 0 is every word)
+        self.count_bits: numpy.ndarray = numpy.stack([
+            numpy.stack([pack_bits(letter_counts[:, letter] >= k) for k in range(self.word_length + 1)])
+            for letter in range(26)
+        ])
+
+        self.all_bits: numpy.ndarray = self.count_bits[0, 0] # Every word
+
+    # Get the set of words matching every constraint.
+    # at / not_at are (position, letter) pairs, min_counts / max_counts map a letter to a count. Letters are codes (0-25).
+    def query(self, at=(), not_at=(), min_counts=None, max_counts=None) -> numpy.ndarray:
+        bits = self.all_bits.copy()
+        for position, letter in at:
+            bits &= self.position_bits[position, letter]
+        for position, letter in not_at:
+            bits &= ~self.position_bits[position, letter]
+        for letter, count in (min_counts or {}).items():
+            if count > self.word_length: return numpy.zeros_like(bits) # No word is long enough
+            bits &= self.count_bits[letter, count]
+        for letter, count in (max_counts or {}).items():
+            if count < self.word_length:
+                bits &= ~self.count_bits[letter, count + 1] # Remove words with more than count of the letter
+        return bits
+
+    # Get the set of words that could give a pattern for a guess. guess is the letter codes of the guessed word.
+    # types is the letter check type for each position (0 = invalid, 1 = valid, 2 = correct)
+    def pattern_bits(self, guess: numpy.ndarray, types: list[int]) -> numpy.ndarray:
+        at = []
+        not_at = []
+        required_counts: dict[int, int] = {}
+        for i, type_ in enumerate(types):
+            letter = int(guess[i])
+            if type_ == 2: # Correct letter has to be in this spot
+                at.append((i, letter))
+            elif type_ == 1: # Valid letter has to be somewhere else
+                not_at.append((i, letter))
+            if type_ == 1 or type_ == 2:
+                required_counts[letter] = required_counts.get(letter, 0) + 1
+
+        # An invalid letter means the word has exactly as many of that letter as were marked valid or correct
+        max_counts = {int(guess[i]): required_counts.get(int(guess[i]), 0) for i, type_ in enumerate(types) if type_ == 0}
+
+        return self.query(at, not_at, required_counts, max_counts)
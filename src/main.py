@@ -1,41 +1,101 @@
+import argparse
+import concurrent.futures
 import os.path
-import h5py
-import pygame
-import numpy
-from words import all_words
-from stuff import LetterCheck, LetterCheckPattern, WordListProcessor
-from feedbacks import compute_feedbacks
+from instrumentation import timed, timed_import, report_timings
+
+# Only pygame is imported straight away because it is needed to open the window.
+# Everything else is heavy so it is imported by load_modules() once the loading screen is showing.
+pygame = timed_import("pygame")
 
 # Define global variables
 screen_width, screen_height = 640, 480
 word_length: int = 5
 guesses: int = 6
-rows: list[list[str]] = [
-    ["" for _ in range(word_length)] for _ in range(guesses)
-]
-row_patterns: list[LetterCheckPattern] = [
-    LetterCheckPattern([LetterCheck(LetterCheck.NONE) for _ in range(word_length)]) for _ in range(guesses)
-]
-current_row_index: int = 0
-current_col_index: int = 0
-input_pattern: bool = False
-best_guesses: list[tuple[str, float]] = []
-feedbacks: list[list[int]] = []
-word_list_processor: WordListProcessor
-
-# Draw the wordle grid to the screen.
-def draw_wordle(screen: pygame.surface.Surface):
-    cell_padding = 0.05 # Fraction of the cell size that is used as the distance between cells
-    size_x = screen_width // 2
+feedbacks: "numpy.ndarray | feedback_cache.DiskFeedbackMatrix"
+word_list_processor: "WordListProcessor"
+session: "Session" # The game being played, holds the grid, the candidates and the best guesses
+
+# Import the heavy modules and make them available as globals
+def load_modules():
+    global numpy, all_words, LetterCheck, WordListProcessor, Session, metrics, feedback_cache
+
+    numpy = timed_import("numpy")
+
+    stuff = timed_import("stuff")
+    LetterCheck, WordListProcessor, metrics = stuff.LetterCheck, stuff.WordListProcessor, list(stuff.metrics)
+
+    Session = timed_import("session").Session
+
+    words = timed_import("words")
+    with timed("load word list"):
+        all_words = words.get_all_words(word_length)
+
+    # The feedbacks module only loads its shared library when it is first used
+    feedback_cache = timed_import("feedback_cache")
+
+# Rendering caches so fonts, letters and the grid aren't rebuilt every frame
+font_cache: dict[tuple[str | None, int, bool], pygame.font.Font] = {} # (font file, size, bold) -> font
+glyph_cache: dict[tuple[str, int], pygame.surface.Surface] = {} # (letter, font size) -> rendered letter
+wordle_surface: pygame.surface.Surface | None = None # Last drawn wordle grid
+wordle_surface_size: tuple[int, int] = (0, 0) # Screen size the grid was drawn for
+wordle_dirty: bool = True # Set when the letters or patterns change so the grid gets redrawn
+best_guesses_font_path = "assets/Iosevka/Iosevka-ExtraBold.ttc"
+best_guess_lines: dict[int, pygame.surface.Surface] = {} # Row -> rendered text for that row of the best guesses
+best_guess_lines_for: "tuple[numpy.ndarray, numpy.ndarray] | None" = None # The ranking the rendered rows belong to
+best_guesses_scroll: int = 0 # Index of the first best guess shown on screen
+dirty_regions: set[str] = {"all"} # Parts of the screen to redraw next frame ("wordle", "possible_words", "best_guesses" or "all")
+drawn_rects: dict[str, pygame.rect.Rect] = {} # Where each part of the screen was last drawn
+
+# Best guesses are worked out on a background thread so the window keeps responding
+solver_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+best_guesses_future: concurrent.futures.Future | None = None
+
+# Get a font, loading it only the first time it is asked for.
+# If path is None (or the file is missing) the system font called fallback_name is used, or the default one if that is None.
+def get_font(size: int, bold: bool = False, path: str | None = None, fallback_name: str | None = None) -> pygame.font.Font:
+    key = (path, size, bold)
+    if key not in font_cache:
+        if path is not None and os.path.exists(path):
+            font_cache[key] = pygame.font.Font(path, size)
+        else:
+            font_cache[key] = pygame.font.SysFont(fallback_name, size, bold)
+    return font_cache[key]
+
+# Get a rendered letter for the wordle grid
+def get_glyph(char: str, font_size: int) -> pygame.surface.Surface:
+    key = (char, font_size)
+    if key not in glyph_cache:
+        glyph_cache[key] = get_font(font_size, True).render(char, True, (255, 255, 255))
+    return glyph_cache[key]
+
+# Draw the wordle grid to the screen and return where it was drawn.
+def draw_wordle(screen: pygame.surface.Surface) -> pygame.rect.Rect:
+    global wordle_surface, wordle_surface_size, wordle_dirty
+
     start_x = screen_width // 8
     start_y = screen_height // 2
+
+    # Only redraw the grid if something changed, otherwise reuse the last one
+    if wordle_dirty or wordle_surface is None or wordle_surface_size != (screen_width, screen_height):
+        wordle_surface = render_wordle()
+        wordle_surface_size = (screen_width, screen_height)
+        wordle_dirty = False
+
+    # Get surface rectangle for the wordle grid and draw it to the main screen with the middle left set to the origin
+    surface_rect = wordle_surface.get_rect(midleft=(start_x, start_y))
+    screen.blit(wordle_surface, surface_rect)
+    return surface_rect
+
+# Draw the wordle grid onto a new surface
+def render_wordle() -> pygame.surface.Surface:
+    cell_padding = 0.05 # Fraction of the cell size that is used as the distance between cells
+    size_x = screen_width // 2
     cell_size = size_x / word_length
     cell_padding_pixels = cell_size * cell_padding
     size_x += cell_padding_pixels * word_length - cell_padding_pixels
     size_y = (cell_size + cell_padding_pixels) * guesses - cell_padding_pixels
 
     font_size = int(cell_size * 0.75)
-    font = pygame.font.SysFont(None, font_size, True)
 
     color_border = (58, 58, 60) # Color for the border
     color_correct = (83, 141, 78) # Color for correct letter
@@ -52,119 +112,161 @@ def draw_wordle(screen: pygame.surface.Surface):
             y = row * (cell_size + cell_padding_pixels)
             rect = pygame.rect.Rect(x,y, cell_size, cell_size) # Create a rectangle for that letter
 
-            letter_check = row_patterns[row].letters[col] # Get the letter check for the row and col of the current letter
-            if letter_check.type == LetterCheck.INVALID:
+            letter_check_type = session.patterns[row, col] # Get the letter check type for the row and col of the current letter
+            if letter_check_type == LetterCheck.INVALID:
                 # If invalid draw solid invalid color
                 pygame.draw.rect(surface, color_invalid, rect)
-            elif letter_check.type == LetterCheck.VALID:
+            elif letter_check_type == LetterCheck.VALID:
                 # If valid draw solid valid color
                 pygame.draw.rect(surface, color_valid, rect)
-            elif letter_check.type == LetterCheck.CORRECT:
+            elif letter_check_type == LetterCheck.CORRECT:
                 # If correct draw solid correct color
                 pygame.draw.rect(surface, color_correct, rect)
-            elif letter_check.type == LetterCheck.NONE:
+            elif letter_check_type == LetterCheck.NONE:
                 # If no letter then just draw the border using border color
                 pygame.draw.rect(surface, color_border, rect, width=2, border_radius=2)
 
             # Draw the letter for the current row and column
-            char = rows[row][col] if col < len(rows[row]) else ""
-            if char != "_" and char != " ":
-                text_surf = font.render(char, True, (255, 255, 255))
+            char = session.letter(row, col)
+            if char != "":
+                text_surf = get_glyph(char, font_size)
                 text_rect = text_surf.get_rect(center=rect.center)
                 surface.blit(text_surf, text_rect)
 
-    # Get surface rectangle for the wordle grid and draw it to the main screen with the middle left set to the origin
-    surface_rect = surface.get_rect(midleft=(start_x, start_y))
-    screen.blit(surface, surface_rect)
+    return surface
 
-# Draw the number of possible answer words at the top of the screen
-def draw_possible_words(screen: pygame.surface.Surface):
-    font = pygame.font.SysFont(None, 32) # Some random font
+# Draw the number of possible answer words at the top of the screen and return where it was drawn
+def draw_possible_words(screen: pygame.surface.Surface) -> pygame.rect.Rect:
+    font = get_font(32) # Some random font
     text_color = (255, 255, 255) # White
 
     # Render text and blit to screen with origin at middle top
-    text_surf = font.render(f"Possible words left: {len(word_list_processor.words)}", True, text_color)
+    text_surf = font.render(f"Possible words left: {len(session.candidates)}", True, text_color)
     text_rect = text_surf.get_rect(midtop=(screen_width // 2, 10))
     screen.blit(text_surf, text_rect)
+    return text_rect
 
-# Draw the best guesses on the right of the screen
-def draw_best_guesses(screen: pygame.surface.Surface):
-    font = pygame.font.Font("assets/Iosevka/Iosevka-ExtraBold.ttc", 24) # Monospace font
-    text_color = (255, 255, 255) # White
+# Draw the best guesses on the right of the screen and return the area they cover.
+# Only the rows that fit on screen are drawn, starting from best_guesses_scroll.
+def draw_best_guesses(screen: pygame.surface.Surface) -> pygame.rect.Rect:
+    global best_guesses_scroll
 
-    y_offset = 25 # Offset for each word on the y axis
+    font = get_font(24, True, best_guesses_font_path, "monospace") # Monospace font
 
-    # Loop over all guesses
-    for guess, bits in best_guesses:
-        text = f"{guess.upper()} : {bits:.2f} bits" # Format text using the word and the bits of information
-        # Render text and set origin
-        text_surf = font.render(text, True, text_color)
-        text_rect = text_surf.get_rect()
-        text_rect.topright = (screen_width, y_offset)
+    y_start = 25 # Offset for the first word on the y axis
+    line_height = font.get_height()
+    visible_rows = max(0, (screen.get_height() - y_start) // line_height) # Number of rows that fit on screen
+
+    ranking = session.ranking # Read once as it is set from the background thread
+    guess_count = 0 if ranking is None else len(ranking[0]) # Nothing to show while they are being worked out
+
+    # Keep the scroll position inside the list
+    best_guesses_scroll = max(0, min(best_guesses_scroll, guess_count - visible_rows))
 
-        # Make sure not to render text that is off-screen
-        if y_offset + text_rect.height > screen.get_height():
-            break
+    drawn_rect = pygame.rect.Rect(screen_width, y_start, 0, 0)
+
+    # Loop over only the visible guesses
+    for row in range(best_guesses_scroll, min(guess_count, best_guesses_scroll + visible_rows)):
+        text_surf = get_best_guess_line(ranking, row, font)
+        text_rect = text_surf.get_rect()
+        text_rect.topright = (screen_width, y_start + (row - best_guesses_scroll) * line_height)
 
         screen.blit(text_surf, text_rect) # Render text
-        y_offset += text_rect.height # Move to next word position
+        drawn_rect.union_ip(text_rect)
+
+    return drawn_rect
+
+# Get the rendered text for one row of the best guesses, rendering it only the first time it is shown
+def get_best_guess_line(ranking: "tuple[numpy.ndarray, numpy.ndarray]", row: int, font: pygame.font.Font) -> pygame.surface.Surface:
+    global best_guess_lines_for
+
+    if best_guess_lines_for is not ranking:
+        # The best guesses have been recalculated so the old lines are out of date
+        best_guess_lines.clear()
+        best_guess_lines_for = ranking
+
+    if row not in best_guess_lines:
+        guesses_ranked, scores = ranking
+        guess = all_words[guesses_ranked[row]]
+        text = f"{guess.upper()} : {format_score(session.metric, scores[row])}" # Format text using the word and its score
+        best_guess_lines[row] = font.render(text, True, (255, 255, 255))
+    return best_guess_lines[row]
+
+# Text for a best guess score, depending on the metric the guesses are sorted by
+def format_score(metric: str, score: float) -> str:
+    if metric == "entropy": return f"{score:.2f} bits"
+    if metric == "expected_remaining": return f"{score:.1f} left"
+    if metric == "worst_case": return f"{score:.0f} worst"
+    return f"{score * 100:.1f}% solve"
+
+# Scroll the best guesses list by a number of rows (negative is up)
+def scroll_best_guesses(rows_to_scroll: int):
+    global best_guesses_scroll
+    best_guesses_scroll = max(0, best_guesses_scroll + rows_to_scroll) # draw_best_guesses stops it going past the end
+    dirty_regions.add("best_guesses")
+
+# Clear an area of the screen and draw everything that overlaps it. Returns where each part of the screen was drawn.
+def redraw_area(screen: pygame.surface.Surface, area: pygame.rect.Rect) -> dict[str, pygame.rect.Rect]:
+    screen.set_clip(area) # Only touch pixels inside the area
+    screen.fill((0,0,0)) # Clear area
+
+    # Render things
+    rects = {
+        "wordle": draw_wordle(screen),
+        "possible_words": draw_possible_words(screen),
+        "best_guesses": draw_best_guesses(screen)
+    }
+
+    screen.set_clip(None)
+    return rects
+
+# Redraw the parts of the screen that changed and only send those parts to the display
+def render_dirty_regions(screen: pygame.surface.Surface):
+    if not dirty_regions: return # Nothing changed
+
+    if "all" in dirty_regions:
+        drawn_rects.update(redraw_area(screen, screen.get_rect()))
+        pygame.display.flip() # Swap front and back buffers
+    else:
+        updated_rects: list[pygame.rect.Rect] = []
+        for region in dirty_regions:
+            # Redraw where it was last time, and also where it is now if that is somewhere new (e.g. longer text)
+            old_rect = drawn_rects.get(region, screen.get_rect())
+            new_rect = redraw_area(screen, old_rect)[region]
+            if not old_rect.contains(new_rect):
+                redraw_area(screen, new_rect)
+            drawn_rects[region] = new_rect
+            updated_rects += [old_rect, new_rect]
+        pygame.display.update(updated_rects) # Only copy the changed rectangles to the window
+
+    dirty_regions.clear()
 
 # Recalculate the best guesses and sort them by bits of information
 def update_best_guesses():
-    global best_guesses
-
-    expected_informations: dict[str, float] = {}
+    global best_guesses_scroll
 
     print("Computing expected information for words.")
-    for word in word_list_processor.words:
-        expected_informations[word] = word_list_processor.expected_information(word)
-
-    print("Sorting best guesses.")
-    best_guesses = sorted(
-        expected_informations.items(),
-        key=lambda item: item[1],
-        reverse=True
-    )
-
-# Handle when the user presses enter
-def handle_wordle_input():
-    global input_pattern, current_col_index, current_row_index, best_guesses
-
-    # If the user hasn't input all letters then don't do anything
-    if rows[current_row_index][current_col_index-1] == "_":
-        return
-
-    # Switch to inputting the pattern instead of letters
-    if not input_pattern:
-        current_col_index = 0
-        input_pattern = True
-        return
-
-    # If the user hasn't input the whole pattern then don't do anything.
-    if row_patterns[current_row_index].letters[current_col_index-1].type == LetterCheck.NONE:
-        return
-
-    # Calculate all possible matches for the word and pattern out of the list of words
-    matches = word_list_processor.get_matches(row_patterns[current_row_index], "".join(rows[current_row_index]).lower())
-    word_list_processor.words = matches # Set the list of words to the matches
-
-    update_best_guesses() # Recalculate best guesses
-
-    # Switch back to letter input and reset input location to the start of the word
-    input_pattern = False
-    current_col_index = 0
-    current_row_index += 1
+    session.rank()
+    best_guesses_scroll = 0 # Go back to the top of the list
 
 def main():
-    global current_col_index, screen_width, screen_height, feedbacks, word_list_processor
+    global screen_width, screen_height, feedbacks, word_list_processor, session, word_length, wordle_dirty, best_guesses_future, best_guesses_scroll
+
+    # Read command line arguments
+    parser = argparse.ArgumentParser(description="Wordle solver")
+    parser.add_argument("--word-length", type=int, default=word_length, help="Number of letters in each word (4 to 8)")
+    parser.add_argument("--low-memory", action="store_true", help="Leave the feedback matrix on disk and only read the rows that are needed")
+    parser.add_argument("--shared", action="store_true", help="Share one copy of the feedback matrix with other solver processes")
+    args = parser.parse_args()
+    word_length = args.word_length
 
-    pygame.init() # Init pygame (duh)
+    with timed("open window"):
+        pygame.init() # Init pygame (duh)
 
-    screen = pygame.display.set_mode((screen_width, screen_height), flags=pygame.RESIZABLE) # Set screen size and allow user to resize the screen
-    pygame.display.set_caption("Wordle solver") # Set the window title
-    icon = pygame.image.load("assets/wordle-icon.png") # Load the icon from assets folder
-    pygame.display.set_icon(icon) # Set window icon to the icon asset
-    clock = pygame.time.Clock() # Create a clock to limit frame rate
+        screen = pygame.display.set_mode((screen_width, screen_height), flags=pygame.RESIZABLE) # Set screen size and allow user to resize the screen
+        pygame.display.set_caption("Wordle solver") # Set the window title
+        icon = pygame.image.load("assets/wordle-icon.png") # Load the icon from assets folder
+        pygame.display.set_icon(icon) # Set window icon to the icon asset
 
     if True: # This is just to create a scope so that these variables aren't accessible in the whole main function
         font = pygame.font.SysFont(None, 32) # Default system font
@@ -175,36 +277,35 @@ def main():
         text_rect = text_surf.get_rect(midtop=(screen_width // 2, 10))
         screen.blit(text_surf, text_rect)
         pygame.display.flip() # Swap front and back buffer to display loading text
+        pygame.event.pump() # Let the window manager know we are alive so the window actually shows up
 
-        # Check for precomputed feedback database file
-        feedbacks_file_path = "assets/feedbacks/precomputed-feedbacks.h5"
-        if os.path.exists(feedbacks_file_path):
-            # If exists load it
-            print("Loading precomputed feedbacks")
-            with h5py.File(feedbacks_file_path, "r") as f:
-                arr = f["matrix"][:]
-                feedbacks = arr.tolist()
+        load_modules() # Now that the loading screen is up import everything else
+
+        # Load the precomputed feedbacks, or compute and save them if they are missing or out of date
+        if args.low_memory:
+            feedbacks = feedback_cache.open_feedbacks(all_words)
+        elif args.shared:
+            feedbacks = timed_import("shared_feedbacks").get_shared_feedbacks(all_words)
         else:
-            # If not exist then invoke shared library to compute it then save to database file
-            print("Precomputed feedbacks not found")
-            print("Computing feedbacks")
-            feedbacks = compute_feedbacks(all_words, word_length)
-            print("Saving feedbacks")
-            arr = numpy.array(feedbacks, dtype=numpy.int16)
-            with h5py.File(feedbacks_file_path, "w") as f:
-                f.create_dataset("matrix", data=arr, compression="gzip")
-
-        # Initialize the word list processor
+            feedbacks = feedback_cache.get_feedbacks(all_words)
+
+        # Initialize the word list processor and start a game
         word_list_processor = WordListProcessor(all_words, feedbacks)
+        session = Session(word_list_processor, guesses)
 
         # Compute the best guesses (this takes forever)
         print("Updating best guess")
-        update_best_guesses()
+        with timed("update best guesses"):
+            update_best_guesses()
+
+        report_timings() # Show where the startup time went
 
     # Main loop
     running = True
     while running:
-        for event in pygame.event.get():
+        # Sleep until something happens. While the best guesses are being worked out wake up every so often to check on them.
+        first_event = pygame.event.wait(50 if best_guesses_future is not None else 0)
+        for event in [first_event] + pygame.event.get():
             if event.type == pygame.QUIT:
                 # If the user presses close then stop the loop on next iteration
                 running = False
@@ -214,57 +315,69 @@ def main():
                 # If the user resizes the window then update the global variables to match
                 screen_width = event.size[0]
                 screen_height = event.size[1]
+                dirty_regions.add("all")
+
+            if event.type == pygame.MOUSEWHEEL:
+                # Scroll the best guesses list with the mouse wheel
+                scroll_best_guesses(-event.y * 3)
+
+            if event.type == pygame.WINDOWEXPOSED:
+                # Window was uncovered so its contents need to be drawn again
+                dirty_regions.add("all")
 
             if event.type == pygame.KEYDOWN:
                 # If the user presses a key
+                wordle_dirty = True # Letters or patterns might change so the grid needs redrawing
+                dirty_regions.add("wordle")
                 key = pygame.key.name(event.key) # Get key pressed as a string
-                if key.isalpha() and len(key) == 1: # Check if the key is a single alphabetical letter
-                    if current_col_index < word_length: # If the current column is inside the word
-                        if input_pattern: # If inputting validity pattern
-                            if key.upper() == "I":
-                                # If invalid
-                                row_patterns[current_row_index].letters[current_col_index].type = LetterCheck.INVALID
-                                current_col_index += 1
-                            elif key.upper() == "V":
-                                # If valid
-                                row_patterns[current_row_index].letters[current_col_index].type = LetterCheck.VALID
-                                current_col_index += 1
-                            elif key.upper() == "C":
-                                # If correct
-                                row_patterns[current_row_index].letters[current_col_index].type = LetterCheck.CORRECT
-                                current_col_index += 1
-                        else:
-                            # Else inputting letters so just record the letter as uppercase to the current column
-                            rows[current_row_index][current_col_index] = key.upper()
-                            current_col_index += 1
+                if event.key == pygame.K_z and event.mod & pygame.KMOD_CTRL:
+                    # Ctrl+Z takes back the last guess (once the best guesses for it are done)
+                    if best_guesses_future is None and session.undo():
+                        best_guesses_scroll = 0
+                        dirty_regions.update(("possible_words", "best_guesses"))
+                elif key.isalpha() and len(key) == 1: # Check if the key is a single alphabetical letter
+                    if session.input_pattern: # If inputting validity pattern
+                        pattern_keys = {"I": LetterCheck.INVALID, "V": LetterCheck.VALID, "C": LetterCheck.CORRECT}
+                        if key.upper() in pattern_keys:
+                            session.type_pattern(pattern_keys[key.upper()])
+                    else:
+                        # Else inputting letters so just record the letter to the current column
+                        session.type_letter(key)
                 if event.key == pygame.K_BACKSPACE:
                     # If user presses backspace then we delete the last letter or pattern
-                    if current_col_index > 0: # Make sure there is something to delete
-                        current_col_index -= 1 # Move back one column
-                        if input_pattern: # Pattern delete
-                            row_patterns[current_row_index].letters[current_col_index].type = LetterCheck.NONE
-                        else: # Letter delete
-                            rows[current_row_index][current_col_index] = "_"
+                    session.backspace()
+                if event.key == pygame.K_TAB:
+                    # Tab switches which metric the best guesses are sorted by, the scores are already worked out
+                    session.set_metric(metrics[(metrics.index(session.metric) + 1) % len(metrics)])
+                    best_guesses_scroll = 0
+                    dirty_regions.add("best_guesses")
+                if event.key == pygame.K_PAGEDOWN or event.key == pygame.K_DOWN:
+                    # Scroll the best guesses list with the keyboard
+                    scroll_best_guesses(10 if event.key == pygame.K_PAGEDOWN else 1)
+                if event.key == pygame.K_PAGEUP or event.key == pygame.K_UP:
+                    scroll_best_guesses(-10 if event.key == pygame.K_PAGEUP else -1)
                 if event.key == pygame.K_RETURN:
-                    # If user presses enter/return key then we want to handle that using the handle_wordle_input function
-                    if current_col_index == word_length: # Check if the current column is at the end of the word
-                        if "".join(rows[current_row_index]).lower() in all_words: # Check if the input word is a valid word
-                            handle_wordle_input() # Handle the input
+                    # If user presses enter/return key then switch to the pattern or submit the guess
+                    if best_guesses_future is None: # Wait for the last guess to finish being processed
+                        if session.enter():
+                            dirty_regions.add("possible_words")
+                            best_guesses_future = solver_executor.submit(update_best_guesses) # Recalculate best guesses in the background
 
         if not running: break # Stop game if not running
 
-        screen.fill((0,0,0)) # Clear screen
-
-        # Render things
-        draw_wordle(screen)
-        draw_possible_words(screen)
-        draw_best_guesses(screen)
+        # Check if the best guesses have finished being worked out
+        if best_guesses_future is not None and best_guesses_future.done():
+            best_guesses_future.result() # Raises any error from the background thread
+            best_guesses_future = None
+            dirty_regions.add("best_guesses")
+            if session.ranking is None:
+                # Something changed while ranking (e.g. the metric) and the ranking wasn't kept, so work it out again
+                best_guesses_future = solver_executor.submit(update_best_guesses)
 
-        # Swap front and back buffers
-        pygame.display.flip()
-        clock.tick(24) # Limit to 24 fps
+        render_dirty_regions(screen) # Only redraw what changed
 
     # Quit pygame after exiting main loop
+    solver_executor.shutdown(wait=False, cancel_futures=True)
     pygame.quit()
 
 if __name__ == "__main__":
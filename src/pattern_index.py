@@ -0,0 +1,53 @@
+import threading
+from collections import OrderedDict
+import numpy
+
+# Inverted index from (guess, pattern) to the words that would give that pattern, stored one guess row at a time in
+# compressed sparse row form: the word indices of the row sorted by pattern id, and pattern_count + 1 offsets so the
+# words for pattern p are order[offsets[p]:offsets[p + 1]]. The words inside each pattern stay in index order.
+# The full index would be as big as the feedback matrix again so rows are only built (in one pass over the row) when
+# a guess is actually made, and the least recently used rows are dropped.
+class PatternIndex:
+    def __init__(self, feedbacks: numpy.ndarray, pattern_count: int, cache_rows: int = 256):
+        self.feedbacks: numpy.ndarray = feedbacks # Array or disk backed matrix, only single rows are read
+        self.word_count: int = feedbacks.shape[0]
+        self.pattern_count: int = pattern_count
+        self.index_dtype: numpy.dtype = numpy.min_scalar_type(max(self.word_count - 1, 0)) # uint16 for up to 65536 words
+        self.cache_rows: int = cache_rows
+        self._rows: OrderedDict[int, tuple[numpy.ndarray, numpy.ndarray]] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    # Sorted word indices and offsets for one guess, building them the first time
+    def row(self, guess: int) -> tuple[numpy.ndarray, numpy.ndarray]:
+        with self._lock:
+            entry = self._rows.get(guess)
+            if entry is not None:
+                self._rows.move_to_end(guess) # Most recently used
+                return entry
+
+        feedback_row = numpy.asarray(self.feedbacks[guess])
+        order = numpy.argsort(feedback_row, kind="stable").astype(self.index_dtype) # Stable so each pattern's words stay sorted
+        offsets = numpy.zeros(self.pattern_count + 1, dtype=numpy.int64)
+        numpy.cumsum(numpy.bincount(feedback_row, minlength=self.pattern_count), out=offsets[1:])
+        order.flags.writeable = False # Slices of it are handed out so it must never change
+        offsets.flags.writeable = False
+
+        with self._lock:
+            self._rows[guess] = (order, offsets)
+            while len(self._rows) > self.cache_rows:
+                self._rows.popitem(last=False)
+        return order, offsets
+
+    # Every word that gives pattern_id when guess is guessed, as a read only slice of the row (no copy)
+    def matches(self, guess: int, pattern_id: int) -> numpy.ndarray:
+        order, offsets = self.row(guess)
+        return order[offsets[pattern_id]:offsets[pattern_id + 1]]
+
+    # Words that give pattern_id for guess and are in candidates (a sorted index array).
+    # Each match is looked up in the candidates so this depends on the number of matches, not the number of words.
+    def matching_candidates(self, guess: int, pattern_id: int, candidates: numpy.ndarray) -> numpy.ndarray:
+        matches = self.matches(guess, pattern_id).astype(numpy.intp)
+        if len(candidates) == self.word_count: return matches # Every word is a candidate
+        if len(candidates) == 0: return candidates[:0]
+        positions = numpy.minimum(numpy.searchsorted(candidates, matches), len(candidates) - 1)
+        return matches[candidates[positions] == matches]
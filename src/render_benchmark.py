@@ -0,0 +1,117 @@
+import argparse
+import os
+import random
+import time
+
+# Use SDL's dummy video driver so this runs without a display (has to be set before pygame is imported)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy
+import main
+from feedbacks import compute_feedbacks
+from session import Session
+from stuff import LetterCheckPattern, WordListProcessor
+from words import WordList, get_all_words
+
+# Headless benchmark of the drawing functions in main.py.
+# Plays scripted games on a slice of the word list and times every frame against an offscreen surface.
+# Run from the repository root: python src/render_benchmark.py
+
+draw_functions = {
+    "draw_wordle": main.draw_wordle,
+    "draw_possible_words": main.draw_possible_words,
+    "draw_best_guesses": main.draw_best_guesses
+}
+
+# Draw one frame onto the surface and record how long each draw function took
+def time_frame(surface, frame_times: dict[str, list[float]]):
+    surface.fill((0,0,0))
+    frame_start = time.perf_counter()
+    for name, draw_function in draw_functions.items():
+        start = time.perf_counter()
+        draw_function(surface)
+        frame_times[name].append(time.perf_counter() - start)
+    frame_times["frame"].append(time.perf_counter() - frame_start)
+
+# Play one game from a random answer, drawing a frame after every state change
+def play_game(surface, session: Session, rng: random.Random, idle_frames: int, frame_times: dict[str, list[float]]):
+    processor = session.processor
+    word_length = processor.word_length
+    answer = rng.randrange(len(processor.all_words))
+
+    # Reset the game state
+    session.reset()
+    main.update_best_guesses()
+    main.wordle_dirty = True
+    time_frame(surface, frame_times)
+
+    for row in range(main.guesses):
+        # Always play the top suggestion
+        guess_word = session.best_guesses(1)[0][0]
+        guess = processor.all_words.index(guess_word)
+        pattern = LetterCheckPattern.from_id(processor.feedbacks[guess, answer], word_length)
+
+        # Type the letters one at a time
+        for letter in guess_word:
+            session.type_letter(letter)
+            main.wordle_dirty = True
+            time_frame(surface, frame_times)
+        session.enter()
+
+        # Type the pattern one at a time
+        for type_ in pattern.types:
+            session.type_pattern(int(type_))
+            main.wordle_dirty = True
+            time_frame(surface, frame_times)
+
+        if guess == answer: break
+
+        # Press enter
+        session.enter()
+        main.update_best_guesses()
+        time_frame(surface, frame_times)
+
+        # Scroll down and back up the best guesses list
+        for scroll in (5, 5, -5, -5):
+            main.best_guesses_scroll = max(0, main.best_guesses_scroll + scroll)
+            time_frame(surface, frame_times)
+
+        # Nothing changes between these frames
+        for _ in range(idle_frames):
+            time_frame(surface, frame_times)
+
+def main_benchmark():
+    parser = argparse.ArgumentParser(description="Time the drawing functions without a display")
+    parser.add_argument("--games", type=int, default=20, help="Number of scripted games to play")
+    parser.add_argument("--words", type=int, default=2000, help="Number of words from the word list to play with")
+    parser.add_argument("--idle-frames", type=int, default=10, help="Frames drawn with nothing changing after each guess")
+    parser.add_argument("--size", type=int, nargs=2, default=(main.screen_width, main.screen_height), help="Surface width and height")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    main.pygame.init()
+    main.load_modules()
+
+    # Small feedback matrix for a slice of the word list so this doesn't need the precomputed file
+    words = WordList(get_all_words(main.word_length).array[:args.words].copy())
+    main.all_words = words
+    main.word_list_processor = WordListProcessor(words, compute_feedbacks(words))
+    main.session = Session(main.word_list_processor, main.guesses)
+
+    main.screen_width, main.screen_height = args.size
+    surface = main.pygame.surface.Surface(args.size) # Offscreen surface to draw on
+
+    frame_times: dict[str, list[float]] = {name: [] for name in [*draw_functions, "frame"]}
+    rng = random.Random(args.seed)
+    for _ in range(args.games):
+        play_game(surface, main.session, rng, args.idle_frames, frame_times)
+
+    # Report the results
+    print(f"{len(frame_times['frame'])} frames at {args.size[0]}x{args.size[1]}")
+    print(f"{'':<22}{'mean ms':>10}{'p99 ms':>10}")
+    for name, times in frame_times.items():
+        times_ms = numpy.array(times) * 1000
+        print(f"{name:<22}{times_ms.mean():>10.3f}{numpy.percentile(times_ms, 99):>10.3f}")
+
+if __name__ == "__main__":
+    main_benchmark()
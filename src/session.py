@@ -0,0 +1,211 @@
+import threading
+import numpy
+from candidate_set import CandidateSet
+from stuff import LetterCheck, LetterCheckPattern, WordListProcessor
+from words import encode_word
+
+# Letter code for a cell that hasn't been typed in yet
+blank_letter = 255
+
+# Candidates, pattern counts and guess scores at the start of a turn, kept so the turn can be undone without recomputing
+# anything. The arrays are read only so a snapshot can never change after it is taken.
+class Snapshot:
+    __slots__ = ("candidates", "counts", "scores", "tree_node")
+
+    def __init__(self, candidates: numpy.ndarray, counts: numpy.ndarray | None, scores: dict[str, numpy.ndarray] | None, tree_node: int):
+        self.candidates: numpy.ndarray = candidates
+        self.counts: numpy.ndarray | None = counts
+        self.scores: dict[str, numpy.ndarray] | None = scores
+        self.tree_node: int = tree_node
+
+# State of one game: the letters and patterns typed into the grid, the words that could still be the answer and the
+# best guesses for them. The feedbacks and word list live in the shared processor so a session is only a few small
+# arrays, and creating or resetting one doesn't compute anything.
+class Session:
+    __slots__ = ("processor", "guess_count", "letters", "patterns", "row", "col", "input_pattern", "candidates", "counts", "scores", "metric", "ranking", "tree_node", "history", "lock")
+
+    def __init__(self, processor: WordListProcessor, guess_count: int = 6, metric: str = "entropy"):
+        self.processor: WordListProcessor = processor
+        self.guess_count: int = guess_count
+        self.metric: str = metric # Which score the best guesses are sorted by, see stuff.metrics
+        self.letters: numpy.ndarray = numpy.empty((guess_count, processor.word_length), dtype=numpy.uint8) # Letter codes, blank_letter if empty
+        self.patterns: numpy.ndarray = numpy.empty((guess_count, processor.word_length), dtype=numpy.int8) # Letter check types
+        self.lock: threading.Lock = threading.Lock() # Keeps the candidates and ranking in step when ranking on another thread
+        self.reset()
+
+    # Go back to an empty grid with every word as a candidate
+    def reset(self):
+        with self.lock:
+            self.letters.fill(blank_letter)
+            self.patterns.fill(LetterCheck.NONE)
+            self.row: int = 0 # Row being typed into
+            self.col: int = 0 # Column being typed into
+            self.input_pattern: bool = False # Typing the pattern instead of the letters
+            self.candidates: numpy.ndarray = self.processor.all_candidates # Shared, so this doesn't copy anything
+            self.counts: numpy.ndarray | None = None # Pattern counts for each candidate as a guess, None until ranked
+            self.scores: dict[str, numpy.ndarray] | None = None # Every metric for each candidate as a guess, None until ranked
+            self.ranking: tuple[numpy.ndarray, numpy.ndarray] | None = None # Guesses sorted by the metric and their scores, None until ranked
+            self.tree_node: int = -1 if self.processor.decision_tree is None else 0 # Node in the decision tree, -1 when off it
+            self.history: list[Snapshot] = [] # One snapshot for every submitted guess, the last one is the turn to go back to
+
+    @property
+    def word_length(self) -> int:
+        return self.processor.word_length
+
+    # Uppercase letter in a cell, or "" if it is empty
+    def letter(self, row: int, col: int) -> str:
+        code = self.letters[row, col]
+        return "" if code == blank_letter else chr(ord("A") + code)
+
+    # Word typed into a row in lowercase, with "_" for empty cells
+    def word(self, row: int) -> str:
+        return "".join(chr(ord("a") + code) if code != blank_letter else "_" for code in self.letters[row])
+
+    def is_finished(self) -> bool:
+        return self.row >= self.guess_count
+
+    # Type a letter into the current row
+    def type_letter(self, letter: str):
+        if self.input_pattern or self.is_finished() or self.col >= self.word_length: return
+        self.letters[self.row, self.col] = ord(letter.lower()) - ord("a")
+        self.col += 1
+
+    # Type a letter check type into the current row's pattern
+    def type_pattern(self, type_: int):
+        if not self.input_pattern or self.is_finished() or self.col >= self.word_length: return
+        self.patterns[self.row, self.col] = type_
+        self.col += 1
+
+    # Delete the last letter or pattern typed
+    def backspace(self):
+        if self.col == 0 or self.is_finished(): return
+        self.col -= 1
+        if self.input_pattern:
+            self.patterns[self.row, self.col] = LetterCheck.NONE
+        else:
+            self.letters[self.row, self.col] = blank_letter
+
+    # Handle the enter key: after a whole word switch to typing its pattern, after a whole pattern submit the guess.
+    # Returns True if a guess was submitted.
+    def enter(self) -> bool:
+        if self.is_finished() or self.col < self.word_length: return False
+        if not self.input_pattern:
+            if self.word(self.row) not in self.processor.all_words: return False
+            self.input_pattern = True
+            self.col = 0
+            return False
+
+        pattern = LetterCheckPattern.from_types([int(type_) for type_ in self.patterns[self.row]])
+        self.submit(self.word(self.row), pattern)
+        return True
+
+    # Fill in the current row with a guess and its pattern and narrow down the candidates
+    def submit(self, word: str, pattern: LetterCheckPattern):
+        with self.lock:
+            if self.is_finished():
+                raise ValueError(f"Every one of the {self.guess_count} guesses has been used")
+            matches = self.processor.get_matches(pattern, word, self.candidates)
+            matches.flags.writeable = False # Ends up in a snapshot so it must never change
+
+            self.history.append(Snapshot(self.candidates, self.counts, self.scores, self.tree_node))
+            if self.tree_node != -1:
+                # Stay on the decision tree as long as its guesses are the ones being played
+                tree = self.processor.decision_tree
+                on_tree = tree.guess(self.tree_node) == self.processor.all_words.find(word)
+                self.tree_node = tree.child(self.tree_node, pattern.id) if on_tree else -1
+            self.letters[self.row] = encode_word(word)
+            self.patterns[self.row] = pattern.types
+            self.candidates = matches
+            self.counts = None
+            self.scores = None
+            self.ranking = None
+            self.row += 1
+            self.col = 0
+            self.input_pattern = False
+
+    # Go back to the turn before the last guess, leaving its word and pattern in the grid so the pattern can be fixed.
+    # Returns False if there is nothing to undo.
+    def undo(self) -> bool:
+        with self.lock:
+            if not self.history: return False
+            snapshot = self.history.pop()
+
+            # Throw away anything typed into the next row
+            if not self.is_finished():
+                self.letters[self.row].fill(blank_letter)
+                self.patterns[self.row].fill(LetterCheck.NONE)
+
+            self.row -= 1
+            self.col = self.word_length
+            self.input_pattern = True
+            self.candidates = snapshot.candidates
+            self.counts = snapshot.counts
+            self.scores = snapshot.scores
+            self.ranking = None if snapshot.scores is None else self.processor.sort_scores(snapshot.scores, snapshot.candidates, self.metric)
+            self.tree_node = snapshot.tree_node
+            return True
+
+    # Sort the best guesses by a different metric, the scores are already worked out so this doesn't rank anything again
+    def set_metric(self, metric: str):
+        with self.lock:
+            ranking = None if self.scores is None else self.processor.sort_scores(self.scores, self.candidates, metric)
+            self.metric = metric
+            self.ranking = ranking
+
+    # Every metric for each candidate as a guess, worked out the first time it is asked for.
+    # The pattern counts are updated from the last turn's counts when that is cheaper than counting again.
+    # Safe to call from another thread while the game carries on.
+    def score(self) -> dict[str, numpy.ndarray]:
+        with self.lock:
+            candidates, scores = self.candidates, self.scores
+            previous = self.history[-1] if self.history else None
+        if scores is not None: return scores
+
+        if candidates is self.processor.all_candidates:
+            counts, scores = self.processor.full_scores() # Same for every new game so it is only worked out once
+        else:
+            candidate_set = CandidateSet.from_indices(candidates, len(self.processor.all_words))
+            cached = self.processor.cached_scores(candidate_set) # Another game might have got to the same candidates
+            if cached is not None:
+                counts, scores = cached
+            else:
+                if previous is not None and previous.counts is not None:
+                    counts = self.processor.shrink_pattern_counts(previous.counts, previous.candidates, candidates)
+                else:
+                    counts = self.processor.pattern_counts(candidates)
+                scores = self.processor.score_counts(counts, self.processor.candidate_total(candidates))
+                for array in (counts, *scores.values()):
+                    array.flags.writeable = False # Ends up in a snapshot and the cache so it must never change
+                self.processor.cache_scores(candidate_set, counts, scores)
+
+        with self.lock:
+            if self.candidates is candidates: # Don't save them if a guess was made while scoring
+                self.counts = counts
+                self.scores = scores
+        return scores
+
+    # Guesses sorted best first by a metric (the session's metric if None) and their scores
+    def rank(self, metric: str | None = None) -> tuple[numpy.ndarray, numpy.ndarray]:
+        with self.lock:
+            candidates, ranking, own_metric = self.candidates, self.ranking, self.metric
+        metric = own_metric if metric is None else metric
+        if ranking is not None and metric == own_metric: return ranking
+
+        scores = self.score()
+        ranking = self.processor.sort_scores(scores, candidates, metric)
+        with self.lock:
+            if self.candidates is candidates and self.ranking is None: # Only keep it if it is still for this turn
+                # The metric can be changed while scoring, so keep the ranking for the metric the session has now
+                self.ranking = ranking if self.metric == metric else self.processor.sort_scores(scores, candidates, self.metric)
+        return ranking
+
+    # Next guess from the decision tree without ranking anything, or None if there is no tree or the game has left it
+    def tree_guess(self) -> str | None:
+        if self.tree_node == -1: return None
+        return self.processor.all_words[self.processor.decision_tree.guess(self.tree_node)]
+
+    # Best guesses as (word, score) pairs, all of them if count is None
+    def best_guesses(self, count: int | None = None, metric: str | None = None) -> list[tuple[str, float]]:
+        guesses, scores = self.rank(metric)
+        words = self.processor.all_words
+        return [(words[guess], float(score)) for guess, score in zip(guesses[:count], scores[:count])]
@@ -0,0 +1,125 @@
+import atexit
+import contextlib
+import json
+import os
+import sys
+import tempfile
+import time
+from multiprocessing import resource_tracker, shared_memory
+import numpy
+import feedback_cache
+from feedbacks import kernel_version
+from words import WordList
+
+# Lets several solver processes on one machine share one copy of the feedback matrix.
+# The first process publishes the matrix into a block of shared memory and writes its name to a small registry file.
+# Every other process finds it in the registry and attaches to it read only, which takes milliseconds and doesn't use
+# any extra memory because all the processes are looking at the same pages.
+
+registry_path = os.path.join(tempfile.gettempdir(), "wordle-solver-shared-feedbacks.json")
+registry_lock_path = registry_path + ".lock"
+registry_lock_timeout = 10 # Seconds before a lock is treated as left behind by a process that crashed
+
+_shared_blocks: list[shared_memory.SharedMemory] = [] # Kept alive for as long as this process is using them
+
+# Key for a word list in the registry, matrices are only shared between processes using the exact same word list and
+# feedbacks kernel
+def registry_key(words: WordList) -> str:
+    return f"{words.word_length}-{kernel_version}-{words.content_hash()}"
+
+# Only let one process change the registry at a time so two publishers can't both read it and lose one of the entries.
+# Creating the lock file fails if it already exists, so whoever creates it holds the lock until it is removed.
+@contextlib.contextmanager
+def registry_lock():
+    while True:
+        try:
+            os.close(os.open(registry_lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            break
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(registry_lock_path) > registry_lock_timeout:
+                    os.remove(registry_lock_path) # Stale, the process holding it never let go
+                    continue
+            except FileNotFoundError:
+                continue # Let go of while checking, try again straight away
+            time.sleep(0.01)
+    try:
+        yield
+    finally:
+        os.remove(registry_lock_path)
+
+def read_registry() -> dict[str, dict]:
+    try:
+        with open(registry_path) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def write_registry(registry: dict[str, dict]):
+    # Write to a temporary file then swap it in so other processes never see a half written registry
+    temporary_path = f"{registry_path}.{os.getpid()}"
+    with open(temporary_path, "w") as f:
+        json.dump(registry, f)
+    os.replace(temporary_path, registry_path)
+
+# Open an existing block of shared memory without this process deleting it when it exits
+def _open_shared_block(name: str) -> shared_memory.SharedMemory:
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name, track=False)
+    block = shared_memory.SharedMemory(name)
+    resource_tracker.unregister(block._name, "shared_memory") # Older pythons would otherwise unlink it on exit
+    return block
+
+# Attach to a published matrix for a word list, returns None if nothing has been published for it
+def attach_feedbacks(words: WordList) -> numpy.ndarray | None:
+    entry = read_registry().get(registry_key(words))
+    if entry is None:
+        return None
+
+    try:
+        block = _open_shared_block(entry["name"])
+    except FileNotFoundError:
+        return None # The publisher has gone and taken the matrix with it
+
+    _shared_blocks.append(block)
+    feedbacks = numpy.ndarray(tuple(entry["shape"]), dtype=entry["dtype"], buffer=block.buf)
+    feedbacks.flags.writeable = False # Everyone shares it so nobody gets to change it
+    return feedbacks
+
+# Load the matrix for a word list into shared memory and add it to the registry.
+# The shared memory is removed when this process exits, processes that are still attached keep their copy working.
+def publish_feedbacks(words: WordList) -> numpy.ndarray:
+    matrix = feedback_cache.get_feedbacks(words)
+
+    block = shared_memory.SharedMemory(create=True, size=max(1, matrix.nbytes))
+    _shared_blocks.append(block)
+    feedbacks = numpy.ndarray(matrix.shape, dtype=matrix.dtype, buffer=block.buf)
+    feedbacks[:] = matrix
+    feedbacks.flags.writeable = False
+
+    key = registry_key(words)
+    with registry_lock():
+        registry = read_registry()
+        registry[key] = {"name": block.name, "shape": list(matrix.shape), "dtype": matrix.dtype.str, "pid": os.getpid()}
+        write_registry(registry)
+    atexit.register(unpublish_feedbacks, key, block)
+    return feedbacks
+
+# Remove a published matrix from the registry and free the shared memory
+def unpublish_feedbacks(key: str, block: shared_memory.SharedMemory):
+    with registry_lock():
+        registry = read_registry()
+        if registry.get(key, {}).get("name") == block.name:
+            del registry[key]
+            write_registry(registry)
+    block.unlink()
+
+# Attach to the shared matrix for a word list if another process has published it, otherwise publish it
+def get_shared_feedbacks(words: WordList) -> numpy.ndarray:
+    feedbacks = attach_feedbacks(words)
+    if feedbacks is None:
+        print("Publishing feedbacks to shared memory")
+        feedbacks = publish_feedbacks(words)
+    else:
+        print("Attached to shared feedbacks")
+    return feedbacks
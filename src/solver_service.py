@@ -0,0 +1,220 @@
+import argparse
+import json
+import secrets
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+import feedback_cache
+from instrumentation import report_timings, timed, timed_import
+from decision_tree import load_decision_tree
+from session import Session
+from stuff import LetterCheckPattern, WordListProcessor, metrics
+from words import get_all_words
+
+# Local HTTP service that keeps one feedback matrix loaded and plays many games at once, so tools can get suggestions
+# without launching the pygame app. Run from the repository root: python src/solver_service.py
+#
+#   POST   /sessions                     start a game, returns {"session": id, "candidates": count}
+#   POST   /sessions/<id>/guesses        {"guess": "tares", "pattern": "01200"} narrows down the candidates
+#   POST   /sessions/<id>/undo           take back the last guess
+#   GET    /sessions/<id>/suggestions?k=10&metric=entropy  best guesses for the game so far
+#   GET    /sessions/<id>/next           next guess, straight from the decision tree when the game is still on it
+#   DELETE /sessions/<id>                end a game
+#
+# Patterns are one character per letter, either 0/1/2 or i/v/c for invalid, valid and correct.
+# Suggestions can be sorted by any of stuff.metrics (entropy, expected_remaining, worst_case or solve_probability).
+
+pattern_characters = {"0": 0, "1": 1, "2": 2, "i": 0, "v": 1, "c": 2}
+
+# Turn a pattern string from a request into a LetterCheckPattern
+def parse_pattern(pattern: str, word_length: int) -> LetterCheckPattern:
+    pattern = pattern.lower()
+    if len(pattern) != word_length or any(character not in pattern_characters for character in pattern):
+        raise ValueError(f"Pattern has to be {word_length} of 0/1/2 or i/v/c, got {pattern!r}")
+    return LetterCheckPattern.from_types([pattern_characters[character] for character in pattern])
+
+class SolverService:
+    def __init__(self, processor: WordListProcessor, workers: int = 4):
+        self.processor: WordListProcessor = processor
+        self.pool: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ranking")
+        self.sessions: dict[str, Session] = {}
+        self.rankings: dict[str, Future] = {} # Ranking being worked out for each session after its last guess
+        self.sessions_lock: threading.Lock = threading.Lock()
+
+        # Every game starts from the full word list so that ranking is worked out once and shared by every new session
+        self.initial_ranking: Future = self.pool.submit(processor.full_scores)
+
+    def create_session(self) -> tuple[str, Session]:
+        session_id = secrets.token_hex(8)
+        session = Session(self.processor) # Cheap, it shares the processor's candidates and ranking until a guess is made
+        with self.sessions_lock:
+            self.sessions[session_id] = session
+        return session_id, session
+
+    def get_session(self, session_id: str) -> Session | None:
+        with self.sessions_lock:
+            return self.sessions.get(session_id)
+
+    def delete_session(self, session_id: str) -> bool:
+        with self.sessions_lock:
+            self.rankings.pop(session_id, None)
+            return self.sessions.pop(session_id, None) is not None
+
+    # Narrow down a game's candidates and start ranking them straight away so the next suggestions are ready sooner
+    def submit_guess(self, session_id: str, session: Session, guess: str, pattern: LetterCheckPattern):
+        session.submit(guess, pattern)
+        ranking = self.pool.submit(session.score)
+        with self.sessions_lock:
+            self.rankings[session_id] = ranking
+
+    # Take back a game's last guess, its candidates and ranking come straight back from the session's history
+    def undo_guess(self, session_id: str, session: Session) -> bool:
+        with self.sessions_lock:
+            self.rankings.pop(session_id, None) # The ranking being worked out was for the guess that is being undone
+        return session.undo()
+
+    # Top k guesses for a game sorted by a metric as (word, score) pairs
+    def suggestions(self, session_id: str, session: Session, k: int, metric: str = "entropy") -> list[tuple[str, float]]:
+        with self.sessions_lock:
+            ranking = self.rankings.get(session_id)
+        (ranking or self.pool.submit(session.score)).result() # Wait for the scores, then this just sorts them
+        return session.best_guesses(k, metric)
+
+    def close(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+class SolverRequestHandler(BaseHTTPRequestHandler):
+    service: SolverService # Set on the subclass made by make_server
+
+    def send_json(self, status: int, body: dict):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def read_json(self) -> dict:
+        length = int(self.headers.get("Content-Length", 0))
+        if length == 0: return {}
+        body = json.loads(self.rfile.read(length))
+        if not isinstance(body, dict): raise ValueError("Request body has to be a JSON object")
+        return body
+
+    # Split the path into its parts and find the session it refers to (if any)
+    def route(self) -> tuple[list[str], dict[str, list[str]], Session | None]:
+        url = urlparse(self.path)
+        parts = [part for part in url.path.split("/") if part]
+        session = self.service.get_session(parts[1]) if len(parts) >= 2 and parts[0] == "sessions" else None
+        return parts, parse_qs(url.query), session
+
+    def do_POST(self):
+        parts, _, session = self.route()
+        try:
+            if parts == ["sessions"]:
+                session_id, session = self.service.create_session()
+                self.send_json(201, {"session": session_id, "candidates": len(session.candidates)})
+            elif len(parts) == 3 and parts[0] == "sessions" and parts[2] == "guesses":
+                if session is None: return self.send_json(404, {"error": "No such session"})
+                body = self.read_json()
+                guess = str(body.get("guess", "")).lower()
+                if guess not in self.service.processor.all_words:
+                    return self.send_json(400, {"error": f"{guess!r} is not in the word list"})
+                pattern = parse_pattern(str(body.get("pattern", "")), self.service.processor.word_length)
+                self.service.submit_guess(parts[1], session, guess, pattern)
+                self.send_json(200, {"candidates": len(session.candidates)})
+            elif len(parts) == 3 and parts[0] == "sessions" and parts[2] == "undo":
+                if session is None: return self.send_json(404, {"error": "No such session"})
+                if not self.service.undo_guess(parts[1], session):
+                    return self.send_json(409, {"error": "No guesses to undo"})
+                self.send_json(200, {"candidates": len(session.candidates)})
+            else:
+                self.send_json(404, {"error": "Not found"})
+        except ValueError as error: # Also covers badly formed JSON
+            self.send_json(400, {"error": str(error)})
+
+    def do_GET(self):
+        parts, query, session = self.route()
+        if len(parts) == 3 and parts[0] == "sessions" and parts[2] == "next":
+            if session is None: return self.send_json(404, {"error": "No such session"})
+            guess = session.tree_guess()
+            from_tree = guess is not None
+            if not from_tree:
+                suggestions = self.service.suggestions(parts[1], session, 1)
+                guess = suggestions[0][0] if suggestions else None
+            self.send_json(200, {"candidates": len(session.candidates), "guess": guess, "from_tree": from_tree})
+        elif len(parts) == 3 and parts[0] == "sessions" and parts[2] == "suggestions":
+            if session is None: return self.send_json(404, {"error": "No such session"})
+            try:
+                k = int(query.get("k", ["10"])[0])
+            except ValueError:
+                return self.send_json(400, {"error": "k has to be a number"})
+            metric = query.get("metric", ["entropy"])[0]
+            if metric not in metrics:
+                return self.send_json(400, {"error": f"metric has to be one of {', '.join(metrics)}"})
+            suggestions = self.service.suggestions(parts[1], session, max(k, 0), metric)
+            self.send_json(200, {
+                "candidates": len(session.candidates),
+                "metric": metric,
+                "suggestions": [{"word": word, "score": score} for word, score in suggestions]
+            })
+        else:
+            self.send_json(404, {"error": "Not found"})
+
+    def do_DELETE(self):
+        parts, _, _ = self.route()
+        if len(parts) == 2 and parts[0] == "sessions" and self.service.delete_session(parts[1]):
+            self.send_response(204)
+            self.end_headers()
+        else:
+            self.send_json(404, {"error": "No such session"})
+
+    def log_message(self, format, *args):
+        pass # Don't print a line for every request
+
+# Make a server for a service, every request is handled on its own thread
+def make_server(service: SolverService, host: str = "127.0.0.1", port: int = 8765) -> ThreadingHTTPServer:
+    handler = type("BoundSolverRequestHandler", (SolverRequestHandler,), {"service": service})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Wordle solver service")
+    parser.add_argument("--word-length", type=int, default=5, help="Number of letters in each word (4 to 8)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=4, help="Threads used to rank guesses")
+    parser.add_argument("--low-memory", action="store_true", help="Leave the feedback matrix on disk and only read the rows that are needed")
+    parser.add_argument("--shared", action="store_true", help="Share one copy of the feedback matrix with other solver processes")
+    args = parser.parse_args()
+
+    words = get_all_words(args.word_length)
+    if args.low_memory:
+        feedbacks = feedback_cache.open_feedbacks(words)
+    elif args.shared:
+        feedbacks = timed_import("shared_feedbacks").get_shared_feedbacks(words)
+    else:
+        feedbacks = feedback_cache.get_feedbacks(words)
+
+    processor = WordListProcessor(words, feedbacks)
+    with timed("load decision tree"):
+        processor.decision_tree = load_decision_tree(words) # Built by decision_tree.py, optional
+    service = SolverService(processor, args.workers)
+    with timed("rank all words"):
+        service.initial_ranking.result()
+    report_timings()
+
+    server = make_server(service, args.host, args.port)
+    print(f"Serving on http://{args.host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+
+if __name__ == "__main__":
+    main()
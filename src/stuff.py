@@ -1,103 +1,273 @@
-import collections
-import math
-from itertools import product
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+import numpy
+from words import WordList, encode_word
+from letter_index import LetterIndex
+from candidate_set import CandidateSet
+from pattern_index import PatternIndex
+if TYPE_CHECKING:
+    from decision_tree import DecisionTree # Only for type hints, decision_tree imports this module
 
 # Single letter check
 class LetterCheck:
+    __slots__ = ("type",)
     NONE = -1
     INVALID = 0
     VALID = 1
     CORRECT = 2
-    def __init__(self, type_: float):
-        self.type: float = type_
+    def __init__(self, type_: int):
+        self.type: int = type_
 
-# Full pattern of letter checks
+# Word lengths the solver supports
+min_word_length = 4
+max_word_length = 8
+
+# Number of different patterns for a word length (each letter can be invalid, valid or correct)
+def pattern_count(word_length: int = 5) -> int:
+    return 3 ** word_length
+
+# Smallest integer type that can hold every pattern id for a word length (uint8 up to 5 letters, uint16 up to 10)
+def pattern_dtype(word_length: int = 5) -> numpy.dtype:
+    if pattern_count(word_length) <= 256:
+        return numpy.dtype(numpy.uint8)
+    return numpy.dtype(numpy.uint16)
+
+# Metrics guesses can be ranked by (see WordListProcessor.score_counts) and whether a bigger score is better
+metrics = {"entropy": True, "expected_remaining": False, "worst_case": False, "solve_probability": True}
+
+_decode_tables: dict[int, numpy.ndarray] = {}
+
+# Table with one row per pattern id holding the letter check type of every position
+def decode_table(word_length: int = 5) -> numpy.ndarray:
+    if word_length not in _decode_tables:
+        ids = numpy.arange(pattern_count(word_length))
+        powers = 3 ** numpy.arange(word_length - 1, -1, -1)
+        table = ((ids[:, None] // powers) % 3).astype(numpy.uint8)
+        table.flags.writeable = False # Shared between every pattern so don't let anything change it
+        _decode_tables[word_length] = table
+    return _decode_tables[word_length]
+
+# Turn an array of letter check types (last axis is the position) into pattern ids.
+# Uses the same base-3 encoding as feedbacks.cpp where the first letter is the most significant digit.
+def encode_patterns(types: numpy.ndarray) -> numpy.ndarray:
+    types = numpy.asarray(types)
+    powers = 3 ** numpy.arange(types.shape[-1] - 1, -1, -1)
+    return types @ powers
+
+# Turn an array of pattern ids into letter check types (adds a position axis on the end)
+def decode_patterns(ids: numpy.ndarray, word_length: int = 5) -> numpy.ndarray:
+    return decode_table(word_length)[ids]
+
+# Full pattern of letter checks, stored as a single base-3 pattern id
 class LetterCheckPattern:
+    __slots__ = ("id", "word_length")
     def __init__(self, letters: list[LetterCheck]):
-        self.letters: list[LetterCheck] = letters
+        self.id: int = int(encode_patterns([letter.type for letter in letters]))
+        self.word_length: int = len(letters)
 
-all_possible_letter_check_patterns: list[LetterCheckPattern] = [
-    LetterCheckPattern([LetterCheck(type_=state_val) for state_val in state])
-    for state in product(range(3), repeat=5)
-] # Computes all possible patterns
+    # Make a pattern straight from its id without going through LetterCheck objects
+    @classmethod
+    def from_id(cls, id_: int, word_length: int = 5) -> "LetterCheckPattern":
+        pattern = cls.__new__(cls)
+        pattern.id = int(id_)
+        pattern.word_length = word_length
+        return pattern
 
-# Class to contain word list, feedbacks, word length and member functions to entropy math on
+    # Make a pattern from a list of letter check types
+    @classmethod
+    def from_types(cls, types: list[int]) -> "LetterCheckPattern":
+        return cls.from_id(encode_patterns(types), len(types))
+
+    # Letter check type of every position
+    @property
+    def types(self) -> numpy.ndarray:
+        return decode_table(self.word_length)[self.id]
+
+    # Letter checks for every position (only made when asked for)
+    @property
+    def letters(self) -> list[LetterCheck]:
+        return [LetterCheck(int(type_)) for type_ in self.types]
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, LetterCheckPattern) and self.id == other.id and self.word_length == other.word_length
+
+    def __hash__(self) -> int:
+        return hash((self.id, self.word_length))
+
+    def __repr__(self) -> str:
+        return f"LetterCheckPattern({self.id}, {self.types.tolist()})"
+
+# Class to contain word list, feedbacks, word length and member functions to entropy math on.
+# Words are referred to by their index in the full word list so everything can work on numpy arrays.
+# feedbacks can be a numpy array or a disk backed matrix from feedback_cache.open_feedbacks
 class WordListProcessor:
-    def __init__(self, words: list[str], feedbacks: list[list[int]]):
-        self.word_length = len(words[0])
-        self.words: list[str] = words
-        self.feedbacks: list[list[int]] = feedbacks
-
-    # Get all matches for a word and pattern
-    def get_matches(self, letter_check_pattern: LetterCheckPattern, word: str) -> list[str]:
-        # Count the number of valid or correct letters in the pattern
-        required_counts = collections.Counter()
-        for i, letter_check in enumerate(letter_check_pattern.letters):
-            if letter_check.type == LetterCheck.VALID or letter_check.type == LetterCheck.CORRECT:
-                required_counts[word[i]] += 1
-
-        matches: list[str] = []
-
-        # Loop over all words
-        for candidate in self.words:
-            valid: bool = True
-
-            # Count the number of times a letter occurs in the candidate
-            candidate_counts = collections.Counter(candidate)
-
-            # Track the number of times a letter is seen
-            seen_counts = collections.Counter()
-            for i in range(self.word_length):
-                # Loop over each letter in the word
-                letter = word[i]
-                candidate_letter = candidate[i]
-
-                if letter_check_pattern.letters[i].type == LetterCheck.INVALID:
-                    # If pattern is invalid make sure there aren't any more of this letter left in the candidate
-                    if candidate_counts[letter] > required_counts.get(letter, 0):
-                        valid = False
-                        break
-                elif letter_check_pattern.letters[i].type == LetterCheck.VALID:
-                    # If valid check that the candidate doesn't have the current letter in the same location and that the candidate has at least one instance of the letter
-                    if letter == candidate_letter or candidate_counts[letter] == 0:
-                        valid = False
-                        break
-                    seen_counts[letter] += 1
-                elif letter_check_pattern.letters[i].type == LetterCheck.CORRECT:
-                    # Check that the candidate letter matches the current letter
-                    if letter != candidate_letter:
-                        valid = False
-                        break
-                    seen_counts[letter] += 1
-            if not valid: continue # If not valid move to the next candidate
-
-            for letter, count in required_counts.items():
-                # Make sure the candidate has at least the required number of letter instances
-                if candidate_counts[letter] < count:
-                    valid = False
-                    break
-
-            if valid: # If valid then add the candidate to the list of matches
-                matches.append(candidate)
-
-        return matches
+    def __init__(self, words: WordList, feedbacks: numpy.ndarray):
+        if not min_word_length <= words.word_length <= max_word_length:
+            raise ValueError(f"Word length must be between {min_word_length} and {max_word_length}, got {words.word_length}")
+        if feedbacks.shape != (len(words), len(words)):
+            raise ValueError(f"Feedback matrix is {feedbacks.shape} but there are {len(words)} words")
+        self.word_length = words.word_length
+        self.all_words: WordList = words
+        self.feedbacks: numpy.ndarray = feedbacks # (word count x word count) feedback ids, row is guess and column is candidate
+        self.all_candidates: numpy.ndarray = numpy.arange(len(words)) # Every word, shared by every game that hasn't guessed yet
+        self.all_candidates.flags.writeable = False
+        self.candidates: numpy.ndarray = self.all_candidates # Indices of the words that could still be the answer
+        self.letter_index: LetterIndex = LetterIndex(words) # Bitsets for fast constraint queries
+        self.pattern_index: PatternIndex = PatternIndex(feedbacks, pattern_count(self.word_length)) # Words giving each pattern for a guess
+        self.decision_tree: "DecisionTree | None" = None # Precomputed guesses from decision_tree.py, if one has been loaded
+        self.priors: numpy.ndarray | None = words.priors # How likely each word is to be the answer, None if they are all equally likely
+        # Big enough for the number of candidates giving a pattern, or their total weight when there are priors
+        self.count_dtype: numpy.dtype = numpy.min_scalar_type(len(words)) if self.priors is None else numpy.dtype(numpy.float64)
+        self._full_scores: tuple[numpy.ndarray, dict[str, numpy.ndarray]] | None = None
+        self._full_scores_lock: threading.Lock = threading.Lock()
+
+        # Pattern counts and scores for recently seen candidate sets so games that reach the same set share them
+        self.scores_cache_size: int = 32
+        self._scores_cache: OrderedDict[CandidateSet, tuple[numpy.ndarray, dict[str, numpy.ndarray]]] = OrderedDict()
+        self._scores_cache_lock: threading.Lock = threading.Lock()
+
+    # Words that could still be the answer (creates a python string for every one so only use this for small lists)
+    @property
+    def words(self) -> list[str]:
+        return [self.all_words[i] for i in self.candidates]
+
+    # Get the indices of all candidates that match a word and pattern.
+    # Uses the processor's own candidates unless a candidates array is given (so one processor can serve many games).
+    def get_matches(self, letter_check_pattern: LetterCheckPattern, word: str, candidates: numpy.ndarray | None = None) -> numpy.ndarray:
+        candidates = self.candidates if candidates is None else candidates
+        guess = self.all_words.find(word)
+        if guess != -1:
+            # Look up the words that give exactly this pattern in the inverted index
+            return self.pattern_index.matching_candidates(guess, letter_check_pattern.id, candidates)
+
+        # Not in the word list so there is no feedback row for it, use the letter constraints instead
+        matches = self.match_set(letter_check_pattern, word) & CandidateSet.from_indices(candidates, len(self.all_words)) # Only keep the ones that are still candidates
+        return matches.to_indices()
+
+    # Set of every word in the word list that fits a word and pattern
+    def match_set(self, letter_check_pattern: LetterCheckPattern, word: str) -> CandidateSet:
+        return CandidateSet(self.letter_index.pattern_bits(encode_word(word), letter_check_pattern.types), len(self.all_words))
+
+    # Feedbacks for some guesses against some candidates (one row per guess)
+    def feedback_block(self, guesses: numpy.ndarray, candidates: numpy.ndarray) -> numpy.ndarray:
+        if isinstance(self.feedbacks, numpy.ndarray):
+            return self.feedbacks[guesses][:, candidates]
+        return self.feedbacks.block(guesses, candidates) # Disk backed matrix only reads the rows that are needed
 
     # Compute average expected information gained for word if used as a guess
-    def expected_information(self, word: str) -> float:
-        exp_info: float = 0
+    def expected_information(self, word_index: int, candidates: numpy.ndarray | None = None) -> float:
+        candidates = self.candidates if candidates is None else candidates
+
+        # For each candidate find the corresponding pattern for it and the guess and count how often each pattern comes up
+        counts = numpy.bincount(self.feedbacks[word_index, candidates], weights=self.candidate_weights(candidates), minlength=pattern_count(self.word_length))
+
+        # Calculate the probabilities of the patterns that come up
+        p = counts[counts > 0] / counts.sum()
+        return float(-(p * numpy.log2(p)).sum())
+
+    # Prior weight of each candidate, or None if every word is equally likely
+    def candidate_weights(self, candidates: numpy.ndarray) -> numpy.ndarray | None:
+        return None if self.priors is None else self.priors[candidates]
+
+    # Number of candidates, or their total prior weight if there are priors
+    def candidate_total(self, candidates: numpy.ndarray) -> float:
+        return len(candidates) if self.priors is None else float(self.priors[candidates].sum())
+
+    # Number of candidates that give each pattern for each guess, one row per guess (guesses default to the candidates).
+    # With priors each candidate counts as its weight instead of 1.
+    # Every guess in a batch gets its own range of bins so the whole batch is counted with one bincount.
+    def pattern_counts(self, candidates: numpy.ndarray | None = None, guesses: numpy.ndarray | None = None, batch_size: int = 512) -> numpy.ndarray:
+        candidates = self.candidates if candidates is None else candidates
+        guesses = candidates if guesses is None else guesses
+        patterns = pattern_count(self.word_length)
+
+        counts = numpy.empty((len(guesses), patterns), dtype=self.count_dtype)
+        for start in range(0, len(guesses), batch_size):
+            rows = guesses[start:start + batch_size]
+            block = self.feedback_block(rows, candidates).astype(numpy.intp)
+            block += (numpy.arange(len(rows)) * patterns)[:, None]
+            weights = None if self.priors is None else numpy.broadcast_to(self.priors[candidates], block.shape).ravel()
+            counts[start:start + len(rows)] = numpy.bincount(block.ravel(), weights=weights, minlength=len(rows) * patterns).reshape(len(rows), patterns)
+        return counts
+
+    # Pattern counts for a smaller set of candidates (a subset of the old one) from the counts for the old set.
+    # If fewer candidates were removed than are left the removed columns are counted and subtracted, so the work depends
+    # on how many were removed. Otherwise it is quicker to count the new candidates from scratch.
+    def shrink_pattern_counts(self, counts: numpy.ndarray, candidates: numpy.ndarray, new_candidates: numpy.ndarray) -> numpy.ndarray:
+        removed = numpy.setdiff1d(candidates, new_candidates, assume_unique=True)
+        if len(removed) >= len(new_candidates):
+            return self.pattern_counts(new_candidates)
+
+        new_counts = counts[numpy.searchsorted(candidates, new_candidates)] # Rows for the guesses that are left (a copy)
+        new_counts -= self.pattern_counts(removed, new_candidates)
+        return new_counts
+
+    # Every way of scoring a guess from its pattern counts (worked out in one pass by score_counts).
+    # N is the number of candidates and c is the number of candidates giving each pattern (both weighted by the priors if
+    # there are any, so with priors the remaining and worst case scores are in terms of average weight words).
+    #   entropy              expected bits of information, log2(N) - sum(c * log2(c)) / N
+    #   expected_remaining   expected number of candidates left after the guess, sum(c^2) / N
+    #   worst_case           most candidates that could be left after the guess, max(c)
+    #   solve_probability    chance of the guess being the answer, c[every letter correct] / N
+    def score_counts(self, counts: numpy.ndarray, candidate_total: float, batch_size: int = 512) -> dict[str, numpy.ndarray]:
+        total = candidate_total if candidate_total > 0 else 1
+        all_correct = pattern_count(self.word_length) - 1
+        scores = {metric: numpy.empty(len(counts)) for metric in metrics}
+
+        for start in range(0, len(counts), batch_size):
+            block = counts[start:start + batch_size].astype(numpy.float64) # Converted once and shared by every metric
+            end = start + len(block)
+            scores["entropy"][start:end] = numpy.log2(total) - (block * numpy.log2(numpy.where(block > 0, block, 1))).sum(axis=1) / total
+            scores["expected_remaining"][start:end] = (block * block).sum(axis=1) / total
+            scores["worst_case"][start:end] = block.max(axis=1, initial=0)
+            scores["solve_probability"][start:end] = block[:, all_correct] / total
+        return scores
+
+    # Sort guesses best first by one of their scores, ties go to the guess with more entropy.
+    # Returns the sorted guess indices and their scores.
+    def sort_scores(self, scores: dict[str, numpy.ndarray], guesses: numpy.ndarray, metric: str = "entropy") -> tuple[numpy.ndarray, numpy.ndarray]:
+        if metric not in metrics:
+            raise ValueError(f"Unknown metric {metric!r}, has to be one of {', '.join(metrics)}")
+        key = -scores[metric] if metrics[metric] else scores[metric]
+        order = numpy.lexsort((-scores["entropy"], key)) # Last key is sorted first, lexsort is stable
+        return guesses[order], scores[metric][order]
+
+    # Score every guess from its pattern counts and sort them best first
+    def rank_counts(self, counts: numpy.ndarray, guesses: numpy.ndarray, candidate_total: float, metric: str = "entropy") -> tuple[numpy.ndarray, numpy.ndarray]:
+        return self.sort_scores(self.score_counts(counts, candidate_total), guesses, metric)
 
-        word_index = self.words.index(word) # Find the index of the word in the list of words
+    # Compute the score of every guess at once and sort them best first (by expected information unless another metric is given).
+    # Guesses default to the candidates themselves. Returns the sorted guess indices and their scores.
+    def rank(self, candidates: numpy.ndarray | None = None, guesses: numpy.ndarray | None = None, metric: str = "entropy", batch_size: int = 512) -> tuple[numpy.ndarray, numpy.ndarray]:
+        candidates = self.candidates if candidates is None else candidates
+        guesses = candidates if guesses is None else guesses
+        return self.rank_counts(self.pattern_counts(candidates, guesses, batch_size), guesses, self.candidate_total(candidates), metric)
 
-        # For each word find the corresponding pattern for it and the input word and increment the counter for that pattern by one
-        counts = collections.Counter()
-        for i in range(len(self.words)):
-            feedback_id = self.feedbacks[word_index][i]
-            counts[feedback_id] += 1
+    # Pattern counts and scores saved for a set of candidates by cache_scores, or None if there aren't any
+    def cached_scores(self, candidate_set: CandidateSet) -> tuple[numpy.ndarray, dict[str, numpy.ndarray]] | None:
+        with self._scores_cache_lock:
+            entry = self._scores_cache.get(candidate_set)
+            if entry is not None:
+                self._scores_cache.move_to_end(candidate_set) # Most recently used
+            return entry
 
-        # Loop over all possible patterns and calculate their probabilities
-        for i in range(len(all_possible_letter_check_patterns)):
-            if counts[i] == 0: continue
-            p = float(counts[i]) / float(len(self.words))
-            exp_info += p * -math.log2(p)
+    # Save the pattern counts and scores for a set of candidates, forgetting the least recently used set if it is full
+    def cache_scores(self, candidate_set: CandidateSet, counts: numpy.ndarray, scores: dict[str, numpy.ndarray]):
+        with self._scores_cache_lock:
+            self._scores_cache[candidate_set] = (counts, scores)
+            self._scores_cache.move_to_end(candidate_set)
+            while len(self._scores_cache) > self.scores_cache_size:
+                self._scores_cache.popitem(last=False)
 
-        return exp_info
\ No newline at end of file
+    # Pattern counts and scores for every word against every word, worked out the first time they are needed and then
+    # shared by every game
+    def full_scores(self) -> tuple[numpy.ndarray, dict[str, numpy.ndarray]]:
+        with self._full_scores_lock:
+            if self._full_scores is None:
+                counts = self.pattern_counts(self.all_candidates)
+                scores = self.score_counts(counts, self.candidate_total(self.all_candidates))
+                for array in (counts, *scores.values()):
+                    array.flags.writeable = False
+                self._full_scores = (counts, scores)
+            return self._full_scores